@@ -4,14 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from qiskit.providers.backend import BackendV2
-
-from backend.transpiling_sampler import TranspilingSampler
 from constants import (
     BACKEND_TYPE,
     IBM_QUANTUM_BACKEND_NAME,
     IBM_QUANTUM_SHOTS,
-    IBM_QUANTUM_TOKEN,
+    get_ibm_quantum_token,
 )
 from enums import BackendType
 from exceptions import InvalidBackendError
@@ -19,6 +16,7 @@ from logger import get_logger
 
 if TYPE_CHECKING:
     from qiskit.primitives import BaseSamplerV2
+    from qiskit.providers.backend import BackendV2
 
 logger = get_logger()
 
@@ -70,12 +68,14 @@ def _get_ibm_quantum_sampler() -> tuple[BaseSamplerV2, BackendV2]:
     from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
     from qiskit_ibm_runtime.models.backend_status import BackendStatus
 
-    token: str | None = IBM_QUANTUM_TOKEN
+    from backend.transpiling_sampler import TranspilingSampler
+
+    token: str | None = get_ibm_quantum_token()
     backend_name: str | None = IBM_QUANTUM_BACKEND_NAME
 
     if not token:
         msg: str = (
-            "IBM Quantum token not configured. Set IBM_QUANTUM_TOKEN in constants.py "
+            "IBM Quantum token not configured. Set IBM_QUANTUM_TOKEN in the .env file "
             "or as environment variable."
         )
         raise InvalidBackendError(msg)
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, cast
 
-from qiskit import transpile
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.primitives import BasePrimitiveJob, BaseSamplerV2
-from qiskit.primitives.containers.sampler_pub_result import SamplerPubResult
-from qiskit.providers.backend import BackendV2
+from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from logger import get_logger
 
@@ -16,6 +15,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from qiskit.primitives.containers import PrimitiveResult, SamplerPubLike
+    from qiskit.primitives.containers.sampler_pub_result import SamplerPubResult
+    from qiskit.providers.backend import BackendV2
 
 logger = get_logger()
 
@@ -40,6 +41,17 @@ class TranspilingSampler(BaseSamplerV2):
         """
         self._sampler: BaseSamplerV2 = sampler
         self._backend: BackendV2 = backend
+        # Building the preset pass manager once amortizes its coupling-map
+        # analysis and plugin discovery over every run() call.
+        self._pass_manager = generate_preset_pass_manager(
+            optimization_level=3, backend=backend
+        )
+        # Transpilation cache keyed on the identity of the parameterized
+        # template circuit. Variational loops resubmit the same template with
+        # only new parameter values, so the expensive layout/routing pass can
+        # be skipped on every call after the first. The source circuit is kept
+        # in the value to guard against id() reuse after garbage collection.
+        self._transpile_cache: dict[int, tuple[QuantumCircuit, QuantumCircuit]] = {}
         logger.debug("TranspilingSampler initialized for backend: %s", backend.name)
 
     def run(
@@ -60,34 +72,79 @@ class TranspilingSampler(BaseSamplerV2):
         """
         logger.debug("Running sampler with automatic transpilation of circuits")
 
-        pub_list: list[SamplerPubLike] = list(pubs)
-        transpiled_pubs: list[SamplerPubLike] = []
+        pub_list: list[SamplerPubLike] = pubs if isinstance(pubs, list) else list(pubs)
+        circuits: list[QuantumCircuit] = [
+            self._extract_circuit(pub) for pub in pub_list
+        ]
 
-        for pub in pub_list:
-            if hasattr(pub, "circuit"):
-                circuit: QuantumCircuit = pub.circuit
-            elif isinstance(pub, tuple) and len(pub) > 0:
-                circuit: QuantumCircuit = pub[0]
-            else:
-                circuit: QuantumCircuit = cast(QuantumCircuit, pub)
+        self._transpile_missing(circuits)
 
-            logger.debug("Transpiling circuit with %s qubits", circuit.num_qubits)
-            transpiled_circuit: QuantumCircuit = transpile(
-                circuit,
-                backend=self._backend,
-                optimization_level=3,
-            )
-            logger.debug(
-                "Transpiled to %s qubits (%s gates)",
-                transpiled_circuit.num_qubits,
-                transpiled_circuit.size(),
-            )
+        transpiled_pubs: list[SamplerPubLike] = [None] * len(pub_list)
+        for idx, (pub, circuit) in enumerate(zip(pub_list, circuits, strict=True)):
+            transpiled_circuit: QuantumCircuit = self._transpile_cache[id(circuit)][1]
 
             if hasattr(pub, "circuit") or isinstance(pub, tuple):
-                transpiled_pubs.append((transpiled_circuit, *pub[1:]))
+                transpiled_pubs[idx] = (transpiled_circuit, *pub[1:])
             else:
-                transpiled_pubs.append(transpiled_circuit)
+                transpiled_pubs[idx] = transpiled_circuit
 
         logger.debug("All circuits transpiled. Submitting to underlying sampler.")
 
         return self._sampler.run(transpiled_pubs, shots=shots)
+
+    @staticmethod
+    def _extract_circuit(pub: SamplerPubLike) -> QuantumCircuit:
+        """Extract the circuit from a pub-like object.
+
+        Args:
+            pub (SamplerPubLike): A pub-like object containing a circuit.
+
+        Returns:
+            QuantumCircuit: The circuit carried by the pub.
+
+        """
+        if hasattr(pub, "circuit"):
+            return pub.circuit
+        if isinstance(pub, tuple) and len(pub) > 0:
+            return pub[0]
+        return cast(QuantumCircuit, pub)
+
+    def _transpile_missing(self, circuits: list[QuantumCircuit]) -> None:
+        """Transpile all circuits not yet in the cache, concurrently when possible.
+
+        Transpilation at optimization_level=3 is CPU-bound; its heavy passes
+        release the GIL, so a thread pool gets near-linear speedup for multi-pub
+        batches without requiring the backend to be picklable.
+
+        Args:
+            circuits (list[QuantumCircuit]): Circuits extracted from the submitted pubs.
+
+        """
+        missing: list[QuantumCircuit] = []
+        for circuit in circuits:
+            cached = self._transpile_cache.get(id(circuit))
+            if cached is not None and cached[0] is circuit:
+                logger.debug(
+                    "Reusing cached transpilation for circuit with %s qubits",
+                    circuit.num_qubits,
+                )
+            elif all(circuit is not seen for seen in missing):
+                logger.debug("Transpiling circuit with %s qubits", circuit.num_qubits)
+                missing.append(circuit)
+
+        if not missing:
+            return
+
+        if len(missing) == 1:
+            transpiled: list[QuantumCircuit] = [self._pass_manager.run(missing[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                transpiled = list(executor.map(self._pass_manager.run, missing))
+
+        for circuit, transpiled_circuit in zip(missing, transpiled, strict=True):
+            self._transpile_cache[id(circuit)] = (circuit, transpiled_circuit)
+            logger.debug(
+                "Transpiled to %s qubits (%s gates)",
+                transpiled_circuit.num_qubits,
+                transpiled_circuit.size(),
+            )
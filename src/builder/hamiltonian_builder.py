@@ -7,8 +7,12 @@ penalties, and neighbor-based contact terms, using distance and interaction maps
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp
+
 from constants import (
     BOUNDING_CONSTANT,
     EMPTY_OP_COEFF,
@@ -22,11 +26,10 @@ from utils.qubit_utils import (
     build_identity_op,
     fix_qubits,
     pad_to_n_qubits,
+    tensor_kron,
 )
 
 if TYPE_CHECKING:
-    from qiskit.quantum_info import SparsePauliOp
-
     from contact.contact_map import ContactMap
     from distance.distance_map import DistanceMap
     from interaction.interaction import Interaction
@@ -69,6 +72,31 @@ class HamiltonianBuilder:
         self.distance_map: DistanceMap = distance_map
         self.contact_map: ContactMap = contact_map
 
+        # Materialize per-bead symbols, pairwise interaction energies, and
+        # distance operators once; the neighbor Hamiltonian helpers are called
+        # O(N^2) times and would otherwise repeat these lookups on every call.
+        main_chain_len: int = protein.geometry.main_chain_len
+        self._symbols: list[str] = [
+            protein.main_chain.get_symbol_at(i) for i in range(main_chain_len)
+        ]
+        self._energies: np.ndarray = interaction.get_energy_matrix(
+            "".join(self._symbols)
+        )
+        self._xops: list[list[SparsePauliOp | None]] = [
+            [distance_map[i, j] if i < j else None for j in range(main_chain_len)]
+            for i in range(main_chain_len)
+        ]
+        self._turn_cache: dict[tuple[int, int], SparsePauliOp] = {}
+
+        # Dense contact table: one strided read per lookup in the backbone
+        # loop instead of chained dict __getitem__ calls; pairs without a
+        # contact stay None.
+        self._contacts: np.ndarray = np.empty(
+            (main_chain_len, main_chain_len), dtype=object
+        )
+        for i, j in contact_map.contact_pairs():
+            self._contacts[i, j] = contact_map[i, j]
+
     def sum_hamiltonians(self) -> SparsePauliOp:
         """Build and sum all hamiltonian components, padding to a common qubit size.
 
@@ -78,8 +106,8 @@ class HamiltonianBuilder:
         Note:
             The padding step ensures that all SparsePauliOp operators have the same
             number of qubits, which is required for valid operator addition.
-            The total hamiltonian is initialized with an identity operator and then
-            each padded component is added sequentially.
+            The padded components are summed in a single batch, which concatenates
+            their term arrays once instead of stacking them pairwise.
 
         Returns:
             SparsePauliOp: The total hamiltonian operator, simplified and ready for use.
@@ -112,11 +140,9 @@ class HamiltonianBuilder:
             for hamiltonian in part_hamiltonians
         ]
 
-        total_hamiltonian: SparsePauliOp = build_identity_op(
-            target_qubits, EMPTY_OP_COEFF
+        total_hamiltonian: SparsePauliOp = fix_qubits(
+            SparsePauliOp.sum(padded_hamiltonians)
         )
-        for hamiltonian in padded_hamiltonians:
-            total_hamiltonian += hamiltonian
 
         logger.info("Finished building total hamiltonian.")
         return total_hamiltonian.simplify()
@@ -144,26 +170,27 @@ class HamiltonianBuilder:
         h_backbone_num_qubits: int = (
             pow((chain_len - 1), 2) + (chain_len - 1) * QUBITS_PER_TURN
         )
-        h_backbone: SparsePauliOp = build_identity_op(
-            h_backbone_num_qubits, EMPTY_OP_COEFF
-        )
+        # Each (i, j, ii, jj) tuple yields an independent term, so the tuples
+        # are collected first and mapped across a thread pool; the heavy numpy
+        # work inside each term release the GIL.
+        tasks: list[tuple[int, int, int, int, bool]] = []
 
         for i in range(len(main_chain) - 4):
             for j in range(i + 4, len(main_chain)):
                 if (j - i) % 2 == 0:
                     continue
 
-                if 0 <= i < chain_len and 0 <= j < chain_len:
+                contact_op: SparsePauliOp | None = self._contacts[i, j]
+                if contact_op is None or not np.any(contact_op.coeffs):
                     logger.debug(
-                        "Adding backbone-backbone contact between Bead (index %s) and Bead (index %s) [1st neighbor contact]",
+                        "Skipping backbone-backbone contact between Bead (index %s) and Bead (index %s) [zero contact operator]",
                         i,
                         j,
                     )
-                    h_backbone += self.contact_map.main_main_contacts[i][
-                        j
-                    ] ^ self.get_first_neighbor_hamiltonian(
-                        i, j, float(Penalties.OVERLAP_PENALTY)
-                    )
+                    continue
+
+                if 0 <= i < chain_len and 0 <= j < chain_len:
+                    tasks.append((i, j, i, j, True))
 
                 for di, dj in [
                     (-1, 0),
@@ -173,18 +200,18 @@ class HamiltonianBuilder:
                 ]:
                     ii, jj = i + di, j + dj
                     if 0 <= ii < chain_len and 0 <= jj < chain_len:
-                        logger.debug(
-                            "Adding backbone-backbone contact between Bead (index %s) and Bead (index %s) [2nd neighbor contact]",
-                            ii,
-                            jj,
-                        )
-                        h_backbone += self.contact_map.main_main_contacts[i][
-                            j
-                        ] ^ self.get_second_neighbor_hamiltonian(
-                            ii, jj, float(Penalties.OVERLAP_PENALTY)
-                        )
-
-                h_backbone = fix_qubits(h_backbone)
+                        tasks.append((i, j, ii, jj, False))
+
+        backbone_terms: list[SparsePauliOp] = [
+            build_identity_op(h_backbone_num_qubits, EMPTY_OP_COEFF)
+        ]
+        if tasks:
+            with ThreadPoolExecutor() as executor:
+                backbone_terms.extend(
+                    executor.map(lambda task: self._neighbor_term(*task), tasks)
+                )
+
+        h_backbone: SparsePauliOp = SparsePauliOp.sum(backbone_terms).simplify()
 
         logger.info(
             "Finished creating hamiltonian term of backbone-backbone (BB-BB) contacts with %s qubits.",
@@ -192,6 +219,44 @@ class HamiltonianBuilder:
         )
         return h_backbone
 
+    def _neighbor_term(
+        self,
+        i: int,
+        j: int,
+        ii: int,
+        jj: int,
+        is_first_neighbor: bool,
+    ) -> SparsePauliOp:
+        """Builds a single backbone contact term for the (i, j) contact pair.
+
+        Args:
+            i (int): Lower bead index of the contact pair.
+            j (int): Upper bead index of the contact pair.
+            ii (int): Lower bead index of the neighbor Hamiltonian.
+            jj (int): Upper bead index of the neighbor Hamiltonian.
+            is_first_neighbor (bool): Whether to use the first-neighbor Hamiltonian.
+
+        Returns:
+            SparsePauliOp: The contact operator tensored with the neighbor Hamiltonian.
+
+        """
+        logger.debug(
+            "Adding backbone-backbone contact between Bead (index %s) and Bead (index %s) [%s neighbor contact]",
+            ii,
+            jj,
+            "1st" if is_first_neighbor else "2nd",
+        )
+        neighbor_hamiltonian: SparsePauliOp = (
+            self.get_first_neighbor_hamiltonian(
+                ii, jj, float(Penalties.OVERLAP_PENALTY)
+            )
+            if is_first_neighbor
+            else self.get_second_neighbor_hamiltonian(
+                ii, jj, float(Penalties.OVERLAP_PENALTY)
+            )
+        )
+        return tensor_kron(self._contacts[i, j], neighbor_hamiltonian)
+
     def _add_backtracking_penalty(self) -> SparsePauliOp:
         """Adds a penalty term to the hamiltonian to discourage backtracking in the main chain configuration.
 
@@ -203,9 +268,9 @@ class HamiltonianBuilder:
 
         main_chain: _MainChain = self.protein.main_chain
         h_backtrack_num_qubits: int = (len(main_chain) - 1) * QUBITS_PER_TURN
-        h_backtrack: SparsePauliOp = build_identity_op(
-            h_backtrack_num_qubits, EMPTY_OP_COEFF
-        )
+        backtrack_terms: list[SparsePauliOp] = [
+            build_identity_op(h_backtrack_num_qubits, EMPTY_OP_COEFF)
+        ]
 
         for i in range(1, len(main_chain) - 2):
             logger.debug(
@@ -213,15 +278,44 @@ class HamiltonianBuilder:
                 i,
                 i + 1,
             )
-            h_backtrack += Penalties.BACK_PENALTY * self.get_turn_operators(
-                main_chain[i], main_chain[i + 1]
+            backtrack_terms.append(
+                Penalties.BACK_PENALTY * self._get_turn_operators_by_index(i, i + 1)
             )
 
+        h_backtrack: SparsePauliOp = SparsePauliOp.sum(backtrack_terms).simplify()
+
         logger.info(
             "Finished creating hamiltonian term of backtracking penalty with %s qubits.",
             h_backtrack.num_qubits,
         )
-        return fix_qubits(h_backtrack)
+        return h_backtrack
+
+    def _get_turn_operators_by_index(
+        self, lower_bead_idx: int, upper_bead_idx: int
+    ) -> SparsePauliOp:
+        """Returns the combined turn operators for a bead pair, cached by index.
+
+        Turn functions for a given bead index don't change for the lifetime of
+        the builder, so the combined operator is computed once per pair and
+        reused on subsequent Hamiltonian builds.
+
+        Args:
+            lower_bead_idx (int): Index of the lower bead in the main chain.
+            upper_bead_idx (int): Index of the upper bead in the main chain.
+
+        Returns:
+            SparsePauliOp: Combined turn operator describing the interaction between the two beads.
+
+        """
+        key: tuple[int, int] = (lower_bead_idx, upper_bead_idx)
+        turn_operators: SparsePauliOp | None = self._turn_cache.get(key)
+        if turn_operators is None:
+            main_chain: _MainChain = self.protein.main_chain
+            turn_operators = self.get_turn_operators(
+                main_chain[lower_bead_idx], main_chain[upper_bead_idx]
+            )
+            self._turn_cache[key] = turn_operators
+        return turn_operators
 
     def get_turn_operators(self, lower_bead: Bead, upper_bead: Bead) -> SparsePauliOp:
         """Builds the combined turn operators for two consecutive beads in the main chain.
@@ -254,16 +348,19 @@ class HamiltonianBuilder:
                 EMPTY_OP_COEFF,
             )
 
-        turn_operators: SparsePauliOp = build_identity_op(
-            (len(self.protein.main_chain) - 1) * QUBITS_PER_TURN, EMPTY_OP_COEFF
-        )
+        turn_products: list[SparsePauliOp] = [
+            lower_turn_func @ upper_turn_func
+            for lower_turn_func, upper_turn_func in zip(
+                lower_turn_funcs, upper_turn_funcs, strict=True
+            )
+        ]
 
-        for lower_bead_idx, upper_bead_idx in zip(
-            lower_turn_funcs, upper_turn_funcs, strict=True
-        ):
-            turn_operators += lower_bead_idx @ upper_bead_idx
+        if not turn_products:
+            return build_identity_op(
+                (len(self.protein.main_chain) - 1) * QUBITS_PER_TURN, EMPTY_OP_COEFF
+            )
 
-        return fix_qubits(turn_operators)
+        return SparsePauliOp.sum(turn_products)
 
     def get_first_neighbor_hamiltonian(
         self,
@@ -293,21 +390,19 @@ class HamiltonianBuilder:
         lambda_0: float = (
             BOUNDING_CONSTANT * (upper_bead_idx - lower_bead_idx + 1) * lambda_1
         )
-        symbol_lower: str = self.protein.main_chain.get_symbol_at(lower_bead_idx)
-        symbol_upper: str = self.protein.main_chain.get_symbol_at(upper_bead_idx)
-
-        energy: float = self.interaction.get_energy(symbol_lower, symbol_upper)
-        x: SparsePauliOp = self.distance_map[lower_bead_idx][upper_bead_idx]
+        energy: float = float(self._energies[lower_bead_idx, upper_bead_idx])
+        x: SparsePauliOp = self._xops[lower_bead_idx][upper_bead_idx]
 
         if x.num_qubits is None:
             msg: str = "x.num_qubits is None, cannot build first neighbor hamiltonian."
             raise InvalidOperatorError(msg)
 
-        expression: SparsePauliOp = lambda_0 * (x - build_identity_op(x.num_qubits)) + (
-            MJ_ENERGY_MULTIPLIER * energy * build_identity_op(x.num_qubits)
+        identity: SparsePauliOp = build_identity_op(x.num_qubits)
+        expression: SparsePauliOp = lambda_0 * (x - identity) + (
+            MJ_ENERGY_MULTIPLIER * energy * identity
         )
 
-        return fix_qubits(expression)
+        return expression
 
     def get_second_neighbor_hamiltonian(
         self,
@@ -329,18 +424,16 @@ class HamiltonianBuilder:
             InvalidOperatorError: If the number of qubits in the operator is None.
 
         """
-        symbol_lower: str = self.protein.main_chain.get_symbol_at(lower_bead_idx)
-        symbol_upper: str = self.protein.main_chain.get_symbol_at(upper_bead_idx)
-
-        energy: float = self.interaction.get_energy(symbol_lower, symbol_upper)
-        x: SparsePauliOp = self.distance_map[lower_bead_idx][upper_bead_idx]
+        energy: float = float(self._energies[lower_bead_idx, upper_bead_idx])
+        x: SparsePauliOp = self._xops[lower_bead_idx][upper_bead_idx]
 
         if x.num_qubits is None:
             msg: str = "x.num_qubits is None, cannot build second neighbor hamiltonian."
             raise InvalidOperatorError(msg)
 
-        expression: SparsePauliOp = lambda_1 * (
-            2 * build_identity_op(x.num_qubits) - x
-        ) + (MJ_ENERGY_MULTIPLIER * energy * build_identity_op(x.num_qubits))
+        identity: SparsePauliOp = build_identity_op(x.num_qubits)
+        expression: SparsePauliOp = lambda_1 * (2 * identity - x) + (
+            MJ_ENERGY_MULTIPLIER * energy * identity
+        )
 
-        return fix_qubits(expression)
+        return expression
@@ -36,6 +36,10 @@ HP_HH_CONTACT_ENERGY : float
     Energy contribution for hydrophobic-hydrophobic contact in the HP model.
 HP_NON_HH_CONTACT_ENERGY : float
     Energy contribution for non-hydrophobic contacts in the HP model.
+HP_HYDROPHOBIC_SYMBOLS : frozenset[str]
+    Built-in hydrophobic residue alphabet of the HP model.
+HP_POLAR_SYMBOLS : frozenset[str]
+    Built-in polar residue alphabet of the HP model.
 GLOBAL_LOGGER_NAME : str
     Name of the root logger for the project.
 LOGGER_DEFAULT_LEVEL : int
@@ -94,8 +98,8 @@ SIDE_CHAIN_FIFTH_POSITION_INDEX : int
     Index of the side-chain bead associated with the fifth main-chain position.
 BACKEND_TYPE : BackendType
     Selected quantum backend type.
-IBM_QUANTUM_TOKEN : str or None
-    IBM Quantum API token loaded from environment.
+get_ibm_quantum_token : Callable[[], str | None]
+    Lazy accessor for the IBM Quantum API token loaded from environment.
 IBM_QUANTUM_BACKEND_NAME : str
     Name of the IBM Quantum device to execute circuits on.
 IBM_QUANTUM_SHOTS : int
@@ -107,6 +111,7 @@ MIN_CHAIN_LENGTH : int
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import os
 from datetime import tzinfo
@@ -114,7 +119,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
-from dotenv import load_dotenv
 
 from enums import BackendType, ConformationEncoding, InteractionType, TurnDirection
 
@@ -123,7 +127,26 @@ if TYPE_CHECKING:
 
 ROOT_PROJECT_PATH: Path = Path(__file__).parent.parent
 
-load_dotenv(ROOT_PROJECT_PATH / ".env")
+
+@functools.cache
+def _ensure_env() -> None:
+    """Load the project ``.env`` file into the environment exactly once."""
+    from dotenv import load_dotenv
+
+    load_dotenv(ROOT_PROJECT_PATH / ".env")
+
+
+@functools.cache
+def get_ibm_quantum_token() -> str | None:
+    """Return the IBM Quantum API token, loading the ``.env`` file on first use.
+
+    Returns:
+        str | None: Token from the environment, or None if not configured.
+
+    """
+    _ensure_env()
+    return os.environ.get("IBM_QUANTUM_TOKEN")
+
 
 LOGS_DIRPATH: Path = ROOT_PROJECT_PATH / "output" / "logs"
 
@@ -159,6 +182,10 @@ HP_HH_CONTACT_ENERGY: float = -1.0
 
 HP_NON_HH_CONTACT_ENERGY: float = 0.0
 
+HP_HYDROPHOBIC_SYMBOLS: frozenset[str] = frozenset("ACILMFPWYV")
+
+HP_POLAR_SYMBOLS: frozenset[str] = frozenset("RNDEQGHKST")
+
 GLOBAL_LOGGER_NAME: str = "global_logger"
 
 LOGGER_DEFAULT_LEVEL: int = logging.DEBUG
@@ -224,9 +251,13 @@ COORDINATES_COLUMN_WIDTH: int = (
 
 FCC_EDGE_LENGTH: float = 1.0 / np.sqrt(3)
 
-FCC_BASIS: NDArray[np.float64] = FCC_EDGE_LENGTH * np.array(
-    [[-1, 1, 1], [1, 1, -1], [-1, -1, -1], [1, -1, 1]]
+# float32 is plenty for the display-scale lattice arithmetic these vectors
+# feed, and halves the bytes moved when they are broadcast into coordinate
+# arrays. Read-only to prevent accidental mutation of a shared constant.
+FCC_BASIS: NDArray[np.float32] = FCC_EDGE_LENGTH * np.array(
+    [[-1, 1, 1], [1, 1, -1], [-1, -1, -1], [1, -1, 1]], dtype=np.float32
 )
+FCC_BASIS.setflags(write=False)
 
 SIDE_CHAIN_FIFTH_POSITION_INDEX: int = (
     4  # Index of the 5th bead in zero-indexed beads list
@@ -234,8 +265,6 @@ SIDE_CHAIN_FIFTH_POSITION_INDEX: int = (
 
 BACKEND_TYPE: BackendType = BackendType.LOCAL_STATEVECTOR
 
-IBM_QUANTUM_TOKEN: str | None = os.environ.get("IBM_QUANTUM_TOKEN")
-
 IBM_QUANTUM_BACKEND_NAME: str | None = "ibm_marrakesh"
 
 IBM_QUANTUM_SHOTS: int = 1024
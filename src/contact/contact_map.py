@@ -7,19 +7,15 @@ This module provides the `ContactMap` class that:
 - Represents contacts as qubit operators (SparsePauliOp) suitable for quantum simulations.
 """
 
-from collections import defaultdict
+from collections.abc import Iterator
 
+import numpy as np
 from qiskit.quantum_info import SparsePauliOp
 
-from constants import MIN_DISTANCE_BETWEEN_CONTACTS
+from constants import MIN_DISTANCE_BETWEEN_CONTACTS, NORM_FACTOR
 from logger import get_logger
 from protein import Protein
-from protein.bead import Bead
-from utils.qubit_utils import (
-    build_identity_op,
-    build_pauli_z_operator,
-    convert_to_qubits,
-)
+from utils.qubit_utils import build_identity_op
 
 logger = get_logger()
 
@@ -27,12 +23,12 @@ logger = get_logger()
 class ContactMap:
     """Represents a contact map for a protein's main chain.
 
-    Stores pairwise contact operators between MainBeads, using Pauli operators
-    to encode whether contacts are present, respecting minimum bond distances
-    and sublattice constraints.
+    Stores the (lower, upper) bead index pairs that can form a contact as
+    structure-of-arrays index vectors; the Pauli contact operators encoding
+    whether a contact is present are built lazily in one batch on first
+    access, respecting minimum bond distances and sublattice constraints.
 
     Attributes:
-        main_main_contacts (dict[int, dict[int, SparsePauliOp]]): Contact operators between main chain beads.
         contacts_detected (int): Total number of contacts detected in the map.
 
     """
@@ -47,17 +43,20 @@ class ContactMap:
             Exception: If contact map initialization fails.
 
         """
-        self.main_main_contacts: dict[int, dict[int, SparsePauliOp]] = defaultdict(
-            lambda: defaultdict()
-        )
+        self._contact_rows: np.ndarray = np.empty(0, dtype=np.int32)
+        self._contact_cols: np.ndarray = np.empty(0, dtype=np.int32)
+        self._contact_z_indices: np.ndarray = np.empty(0, dtype=np.int32)
+        self._operator_cache: dict[tuple[int, int], SparsePauliOp] = {}
 
         self.contacts_detected: int = 0
         self._protein: Protein = protein
 
-        self._num_contact_qubits: int = pow(len(self._protein.main_chain) - 1, 2)
-        self._full_identity: SparsePauliOp = build_identity_op(
-            num_qubits=self._num_contact_qubits
-        )
+        # Intentionally quadratic: each (lower, upper) pair owns its own
+        # contact-flag qubit at index lower * (main_chain_len - 1) + upper,
+        # so the register must span the full (N-1) x (N-1) index grid. This
+        # register is separate from the (N-1) * QUBITS_PER_TURN turn qubits
+        # used by DistanceMap.
+        self._num_contact_qubits: int = pow(protein.geometry.main_chain_len - 1, 2)
 
         try:
             logger.debug("Initializing ContactMap...")
@@ -76,93 +75,96 @@ class ContactMap:
 
         Note:
             The minimum distance between residues for forming a contact is set by the constant
-            MIN_DISTANCE_BETWEEN_CONTACTS = 5. This ensures that contacts are only considered
-            between residues separated by at least five positions in the sequence, which is
-            consistent with the geometric constraints of the tetrahedral lattice representation.
+            MIN_DISTANCE_BETWEEN_CONTACTS = 5 and enforced directly by the bead-pair
+            enumeration, so only pairs separated by at least five positions in the sequence
+            are visited. This is consistent with the geometric constraints of the
+            tetrahedral lattice representation.
+
+            Only the bead index pairs are stored here, as structure-of-arrays
+            index vectors; the contact operators themselves are built lazily
+            in one batch on first access.
 
         """
-        main_main_contacts_count: int = 0
-        main_chain_length: int = len(self._protein.main_chain)
         logger.debug("Initializing MainBead-MainBead contacts...")
 
-        for lower_bead_idx in range(main_chain_length - 2):
-            for upper_bead_idx in range(lower_bead_idx + 2, main_chain_length):
-                upper_bead: Bead = self._protein.main_chain[upper_bead_idx]
-                lower_bead: Bead = self._protein.main_chain[lower_bead_idx]
-                logger.debug(
-                    "Evaluating potential contact between MainBeads: %s (index: %s) and %s (index: %s)",
-                    upper_bead.symbol,
-                    upper_bead.index,
-                    lower_bead.symbol,
-                    lower_bead.index,
-                )
-
-                if upper_bead.sublattice == lower_bead.sublattice:
-                    logger.debug(
-                        "Skipping contact between MainBeads: %s (index: %s) and %s (index: %s) due to same sublattice \n",
-                        upper_bead.symbol,
-                        upper_bead.index,
-                        lower_bead.symbol,
-                        lower_bead.index,
-                    )
-                    continue
-
-                if (
-                    abs(upper_bead.index - lower_bead.index)
-                    < MIN_DISTANCE_BETWEEN_CONTACTS
-                ):
-                    logger.debug(
-                        "Skipping contact between MainBeads: %s (index: %s) and %s (index: %s) due to insufficient bond separation (min=%s, actual=%s)\n",
-                        upper_bead.symbol,
-                        upper_bead.index,
-                        lower_bead.symbol,
-                        lower_bead.index,
-                        MIN_DISTANCE_BETWEEN_CONTACTS,
-                        abs(upper_bead.index - lower_bead.index),
-                    )
-                    continue
-
-                contact_operator: SparsePauliOp = self._create_main_main_contact(
-                    upper_bead=upper_bead, lower_bead=lower_bead
-                )
-
-                self.main_main_contacts[lower_bead.index][upper_bead.index] = (
-                    contact_operator
-                )
-                self.contacts_detected += 1
-                main_main_contacts_count += 1
-                logger.debug(" ")
-
-        logger.info(
-            "Calculated %s MainBead-MainBead contacts", main_main_contacts_count
+        if self._protein.geometry.main_chain_len - 1 < MIN_DISTANCE_BETWEEN_CONTACTS:
+            logger.info(
+                "Chain too short for any MainBead-MainBead contact; skipping initialization."
+            )
+            return
+
+        sublattices = self._protein.geometry.sublattices
+
+        lower_indices, upper_indices = self._protein.geometry.bead_pairs(
+            min_separation=MIN_DISTANCE_BETWEEN_CONTACTS
         )
+        different_sublattice = sublattices[lower_indices] != sublattices[upper_indices]
 
-    def _create_main_main_contact(
-        self, upper_bead: Bead, lower_bead: Bead
-    ) -> SparsePauliOp:
-        """Creates a contact operator between two main chain MainBeads.
+        self._contact_rows = lower_indices[different_sublattice].astype(np.int32)
+        self._contact_cols = upper_indices[different_sublattice].astype(np.int32)
+        self._contact_z_indices = (
+            self._contact_rows * (self._protein.geometry.main_chain_len - 1)
+            + self._contact_cols
+        )
 
-        Args:
-            lower_bead (Bead): The bead from the main chain at the lower index.
-            upper_bead (Bead): The bead from the main chain at the upper index.
+        self.contacts_detected = int(self._contact_rows.size)
+        logger.info("Calculated %s MainBead-MainBead contacts", self.contacts_detected)
 
-        Returns:
-            SparsePauliOp: Pauli-Z operator for the contact between the two MainBeads.
+    def _build_contact_operators(self) -> None:
+        """Materializes contact operators for all stored pairs in one batch.
 
+        The Pauli-Z operators for all valid pairs are built in a single batched
+        `SparsePauliOp.from_sparse_list` call instead of one `PauliList`
+        construction per pair, and cached for subsequent lookups.
         """
-        z_op_index: int = (lower_bead.index) * (len(self._protein.main_chain) - 1) + (
-            upper_bead.index
+        z_operators: SparsePauliOp = SparsePauliOp.from_sparse_list(
+            [
+                ("Z", [z_op_index], 1.0)
+                for z_op_index in self._contact_z_indices.tolist()
+            ],
+            num_qubits=self._num_contact_qubits,
         )
-
-        contact_operator = build_pauli_z_operator(
-            num_qubits=self._num_contact_qubits, pauli_z_indices={z_op_index}
+        full_identity: SparsePauliOp = build_identity_op(
+            num_qubits=self._num_contact_qubits
         )
 
-        logger.debug(
-            "Created contact operator between MainBeads: %s (index: %s) and %s (index: %s)",
-            lower_bead.symbol,
-            lower_bead.index,
-            upper_bead.symbol,
-            upper_bead.index,
+        for term_idx, (lower_bead_idx, upper_bead_idx) in enumerate(
+            self.contact_pairs()
+        ):
+            self._operator_cache[lower_bead_idx, upper_bead_idx] = NORM_FACTOR * (
+                full_identity - z_operators[term_idx]
+            )
+
+    def contact_pairs(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the (lower, upper) bead index pairs forming contacts.
+
+        Returns:
+            Iterator[tuple[int, int]]: Iterator of (lower, upper) bead index pairs.
+
+        """
+        return zip(
+            self._contact_rows.tolist(), self._contact_cols.tolist(), strict=True
         )
-        return convert_to_qubits(contact_operator)
+
+    def __getitem__(self, key: tuple[int, int]) -> SparsePauliOp:
+        """Get the contact operator for a given bead index pair.
+
+        Args:
+            key (tuple[int, int]): (lower, upper) bead index pair.
+
+        Returns:
+            SparsePauliOp: Contact operator for the bead pair.
+
+        """
+        if not self._operator_cache and self.contacts_detected:
+            self._build_contact_operators()
+        return self._operator_cache[key]
+
+    def __len__(self) -> int:
+        """Return the number of contacts stored in the map.
+
+        Returns:
+            int: Number of (lower, upper) contact pairs detected.
+
+        """
+        return self.contacts_detected
@@ -9,7 +9,6 @@ This module provides the ``DistanceMap`` class, which:
   quantum simulations of protein folding.
 """
 
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from qiskit.quantum_info import SparsePauliOp
@@ -47,16 +46,10 @@ class DistanceMap:
 
         """
         self._protein: Protein = protein
-        self._main_chain_len: int = len(self._protein.main_chain)
+        self._main_chain_len: int = protein.geometry.main_chain_len
 
         self._pauli_op_len: int = (self._main_chain_len - 1) * QUBITS_PER_TURN
-        self._distance_map: defaultdict[int, defaultdict[int, SparsePauliOp]] = (
-            defaultdict(
-                lambda: defaultdict(
-                    lambda: build_identity_op(self._pauli_op_len, EMPTY_OP_COEFF)
-                )
-            )
-        )
+        self._distance_map: dict[tuple[int, int], SparsePauliOp] = {}
 
         self._main_chain_distances_detected: int = 0
 
@@ -83,81 +76,101 @@ class DistanceMap:
             Each axis in the distance vector corresponds to a dimension in the
             tetrahedral lattice representation. The `sub_lattice_sign` alternates between +1 and -1 depending
             on the bead index, reflecting the sublattice structure of the main chain.
+            Per axis, the signed turn functions are accumulated once into prefix
+            sums `P[k]`, so each pair's axis operator is the single subtraction
+            `P[upper] - P[lower]` instead of re-summing the whole bead range.
 
         """
-        for lower_bead_idx in range(self._main_chain_len):
-            for upper_bead_idx in range(lower_bead_idx + 1, self._main_chain_len):
-                lower_bead: Bead = self._protein.main_chain[lower_bead_idx]
-                upper_bead: Bead = self._protein.main_chain[upper_bead_idx]
-
-                axes_vector: list[SparsePauliOp] = [
-                    build_identity_op(self._pauli_op_len, EMPTY_OP_COEFF)
-                    for _ in range(DIST_VECTOR_AXES)
-                ]
-
-                for k in range(lower_bead_idx, upper_bead_idx):
-                    indic_funcs = self._protein.main_chain[k].turn_funcs()
-                    if indic_funcs is None:
-                        logger.debug(
-                            "Skipping distance calculation between MainBeads: %s (index: %s) and %s (index: %s) due to undefined turn functions",
-                            lower_bead.symbol,
-                            lower_bead.index,
-                            upper_bead.symbol,
-                            upper_bead.index,
-                        )
-                        continue
-
-                    sub_lattice_sign: int = (-1) ** k
-
-                    for axis_idx, indic_fun_x in enumerate(indic_funcs):
-                        axes_vector[axis_idx] += sub_lattice_sign * indic_fun_x
-
-                for axis_idx in range(len(axes_vector)):
-                    axes_vector[axis_idx] = fix_qubits(axes_vector[axis_idx])
-                    self._distance_map[lower_bead_idx][upper_bead_idx] += (
-                        axes_vector[axis_idx] ** 2
-                    )
-
-                self._distance_map[lower_bead_idx][upper_bead_idx] = fix_qubits(
-                    self._distance_map[lower_bead_idx][upper_bead_idx]
+        turn_cache: list[tuple[SparsePauliOp, ...] | None] = [
+            bead.turn_funcs() for bead in self._protein.main_chain
+        ]
+        sign_cache: list[int] = [
+            1 if (k & 1) == 0 else -1 for k in range(self._main_chain_len)
+        ]
+
+        prefix: list[list[SparsePauliOp]] = [
+            [build_identity_op(self._pauli_op_len, EMPTY_OP_COEFF)]
+            for _ in range(DIST_VECTOR_AXES)
+        ]
+
+        for k in range(self._main_chain_len - 1):
+            indic_funcs = turn_cache[k]
+            if indic_funcs is None:
+                logger.debug(
+                    "Skipping MainBead (index: %s) in distance prefix sums due to undefined turn functions",
+                    k,
                 )
-                self._main_chain_distances_detected += 1
+                for axis_prefix in prefix:
+                    axis_prefix.append(axis_prefix[-1])
+                continue
 
-                logger.debug(
-                    "Calculated distance operator between MainBeads: %s (index: %s) and %s (index: %s)",
-                    lower_bead.symbol,
-                    lower_bead.index,
-                    upper_bead.symbol,
-                    upper_bead.index,
+            sub_lattice_sign: int = sign_cache[k]
+
+            for axis_idx, indic_fun_x in enumerate(indic_funcs):
+                prefix[axis_idx].append(
+                    prefix[axis_idx][-1] + sub_lattice_sign * indic_fun_x
                 )
 
-    def __getitem__(self, key: int) -> defaultdict[int, SparsePauliOp]:
-        """Get the distance map entry for a given bead index.
+        lower_indices, upper_indices = self._protein.geometry.bead_pairs(
+            min_separation=1
+        )
+
+        for lower_bead_idx, upper_bead_idx in zip(
+            lower_indices.tolist(), upper_indices.tolist(), strict=True
+        ):
+            lower_bead: Bead = self._protein.main_chain[lower_bead_idx]
+            upper_bead: Bead = self._protein.main_chain[upper_bead_idx]
+
+            # fix_qubits distributes over sums and products of Pauli terms
+            # (the sign flips compose by parity and the fixed z columns end
+            # up zeroed either way), so one call on the summed operator
+            # replaces the four per-axis calls.
+            squared_axes: list[SparsePauliOp] = [
+                (prefix[axis_idx][upper_bead_idx] - prefix[axis_idx][lower_bead_idx])
+                ** 2
+                for axis_idx in range(DIST_VECTOR_AXES)
+            ]
+
+            self._distance_map[lower_bead_idx, upper_bead_idx] = fix_qubits(
+                SparsePauliOp.sum(squared_axes)
+            )
+            self._main_chain_distances_detected += 1
+
+            logger.debug(
+                "Calculated distance operator between MainBeads: %s (index: %s) and %s (index: %s)",
+                lower_bead.symbol,
+                lower_bead.index,
+                upper_bead.symbol,
+                upper_bead.index,
+            )
+
+    def __getitem__(self, key: tuple[int, int]) -> SparsePauliOp:
+        """Get the distance operator for a given bead index pair.
 
         Args:
-            key (int): Index of the bead.
+            key (tuple[int, int]): (lower, upper) bead index pair.
 
         Returns:
-            defaultdict[int, SparsePauliOp]: Distance map entry for the bead.
+            SparsePauliOp: Distance operator for the bead pair.
 
         """
         return self._distance_map[key]
 
-    def __setitem__(self, key: int, value: defaultdict[int, SparsePauliOp]) -> None:
-        """Set the distance map entry for a given bead index.
+    def __setitem__(self, key: tuple[int, int], value: SparsePauliOp) -> None:
+        """Set the distance operator for a given bead index pair.
 
         Args:
-            key (int): Index of the bead.
-            value (defaultdict[int, SparsePauliOp]): Distance map entry to assign.
+            key (tuple[int, int]): (lower, upper) bead index pair.
+            value (SparsePauliOp): Distance operator to assign.
 
         """
         self._distance_map[key] = value
 
     def __len__(self) -> int:
-        """Return the number of beads in the distance map.
+        """Return the number of bead pairs in the distance map.
 
         Returns:
-            int: Number of beads stored in the distance map.
+            int: Number of bead pairs stored in the distance map.
 
         """
         return len(self._distance_map)
@@ -33,8 +33,10 @@ import numpy as np
 
 from constants import (
     HP_HH_CONTACT_ENERGY,
+    HP_HYDROPHOBIC_SYMBOLS,
     HP_INTERACTION_MATRIX_FILEPATH,
     HP_NON_HH_CONTACT_ENERGY,
+    HP_POLAR_SYMBOLS,
 )
 from exceptions import UnsupportedAminoAcidSymbolError
 from interaction import Interaction
@@ -50,6 +52,8 @@ class HPInteraction(Interaction):
     pairwise energy function where only H-H contacts contribute negatively.
     """
 
+    __slots__ = ("_hp_mask", "_hydrophobic_symbols")
+
     def __init__(
         self,
         interaction_matrix_path: Path = HP_INTERACTION_MATRIX_FILEPATH,
@@ -62,16 +66,61 @@ class HPInteraction(Interaction):
         """
         super().__init__(interaction_matrix_path)
         logger.debug("Initializing HPInteraction...")
-        self._hydrophobic_symbols, _polar_symbols = self._load_hp_symbols(
-            self._interaction_matrix_path
-        )
-        self.valid_symbols = set(self._hydrophobic_symbols) | set(_polar_symbols)
+
+        if self._interaction_matrix_path == HP_INTERACTION_MATRIX_FILEPATH:
+            # The default HP classification is a fixed biological constant,
+            # so the built-in alphabet skips all file I/O.
+            self._fill_tables(
+                hydrophobic=sorted(HP_HYDROPHOBIC_SYMBOLS),
+                polar=sorted(HP_POLAR_SYMBOLS),
+            )
+        else:
+            cached_tables = self._load_cached_tables()
+            if cached_tables is None or "hydrophobic" not in cached_tables:
+                hydrophobic, polar = self._load_hp_symbols(
+                    self._interaction_matrix_path
+                )
+                self._fill_tables(hydrophobic=hydrophobic, polar=polar)
+                self._save_cached_tables(
+                    hydrophobic=np.array(
+                        [ord(symbol) for symbol in hydrophobic], dtype=np.uint8
+                    )
+                )
+            else:
+                self._hydrophobic_symbols = frozenset(
+                    chr(code) for code in cached_tables["hydrophobic"].tolist()
+                )
+
+        # Bitmask over ASCII codes: _is_hydrophobic becomes a shift-and-test
+        # instead of a hash lookup.
+        self._hp_mask: int = 0
+        for symbol in self._hydrophobic_symbols:
+            self._hp_mask |= 1 << ord(symbol)
 
         logger.info(
             "HPInteraction initialized with %s valid amino acid symbols",
             len(self.valid_symbols),
         )
 
+    def _fill_tables(self, hydrophobic: list[str], polar: list[str]) -> None:
+        """Populate the symbol sets and ASCII-indexed lookup tables.
+
+        Args:
+            hydrophobic (list[str]): Hydrophobic amino acid symbols.
+            polar (list[str]): Polar amino acid symbols.
+
+        """
+        self._hydrophobic_symbols: frozenset[str] = frozenset(hydrophobic)
+        self.valid_symbols = set(self._hydrophobic_symbols) | set(polar)
+
+        valid_codes = [ord(symbol) for symbol in self.valid_symbols]
+        hydrophobic_codes = [ord(symbol) for symbol in self._hydrophobic_symbols]
+        self._energy[np.ix_(valid_codes, valid_codes)] = HP_NON_HH_CONTACT_ENERGY
+        self._energy[np.ix_(hydrophobic_codes, hydrophobic_codes)] = (
+            HP_HH_CONTACT_ENERGY
+        )
+        self._valid[valid_codes] = True
+
     def _load_hp_symbols(
         self, hp_filepath: Path = HP_INTERACTION_MATRIX_FILEPATH
     ) -> tuple[list[str], list[str]]:
@@ -94,13 +143,15 @@ class HPInteraction(Interaction):
         hydrophobic: list[str] = []
         polar: list[str] = []
         try:
-            hp_matrix = np.loadtxt(hp_filepath, dtype=str)
-
-            for line in hp_matrix:
-                if line[1] == "1":
-                    hydrophobic.extend(line[0])
+            for line in hp_filepath.read_text().splitlines():
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
+                symbol, flag = stripped.split(None, 1)
+                if flag[0] == "1":
+                    hydrophobic.append(symbol)
                 else:
-                    polar.extend(line[0])
+                    polar.append(symbol)
         except Exception:
             logger.exception("Error loading HP matrix")
             raise
@@ -123,7 +174,7 @@ class HPInteraction(Interaction):
             bool: True if the symbol is hydrophobic, False otherwise.
 
         """
-        return symbol in self._hydrophobic_symbols
+        return bool((self._hp_mask >> ord(symbol)) & 1)
 
     def get_energy(self, symbol_i: str, symbol_j: str) -> float:
         """Return the HP model pair energy.
@@ -142,13 +193,15 @@ class HPInteraction(Interaction):
             UnsupportedAminoAcidSymbolError: If either residue symbol is not in the HP matrix.
 
         """
-        if symbol_i not in self.valid_symbols or symbol_j not in self.valid_symbols:
+        try:
+            code_i, code_j = ord(symbol_i), ord(symbol_j)
+            supported = bool(self._valid[code_i] and self._valid[code_j])
+        except (TypeError, IndexError):
+            supported = False
+
+        if not supported:
             msg: str = f"Amino acid symbols of {symbol_i}, {symbol_j} not supported in loaded HP interaction model"
             logger.error(msg)
             raise UnsupportedAminoAcidSymbolError(msg)
 
-        return (
-            HP_HH_CONTACT_ENERGY
-            if (self._is_hydrophobic(symbol_i) and self._is_hydrophobic(symbol_j))
-            else HP_NON_HH_CONTACT_ENERGY
-        )
+        return float(self._energy[code_i, code_j])
@@ -9,21 +9,39 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from exceptions import UnsupportedAminoAcidSymbolError
+from logger import get_logger
+
 if TYPE_CHECKING:
     from pathlib import Path
 
+logger = get_logger()
+
+ASCII_TABLE_SIZE: int = 128
+
 
 class Interaction(ABC):
     """Abstract base class for interaction models.
 
     Subclasses must implement `get_energy` to return a numeric energy value and define their own initialization logic.
-    Subclasses should also manage to properly set the `valid_symbols` set to determine which amino acid symbols they support.
+    Subclasses should also manage to properly set the `valid_symbols` set to determine which amino acid symbols they support,
+    and populate the ASCII-indexed `_energy` / `_valid` lookup tables that back the energy queries.
 
     Attributes:
         valid_symbols (set[str]): Set of valid amino acid symbols for the interaction model.
 
     """
 
+    __slots__ = (
+        "_energy",
+        "_interaction_matrix_path",
+        "_valid",
+        "_valid_bytes",
+        "valid_symbols",
+    )
+
     def __init__(self, interaction_matrix_path: Path) -> None:
         """Initialize the interaction model.
 
@@ -34,6 +52,17 @@ class Interaction(ABC):
         self._interaction_matrix_path: Path = interaction_matrix_path
         self.valid_symbols: set[str] = set()
 
+        # ASCII-indexed lookup tables: _energy[ord(a), ord(b)] holds the pair
+        # energy and _valid[ord(s)] marks supported one-letter symbols. A
+        # single fancy-index replaces per-pair dict/set lookups on the
+        # O(N^2) Hamiltonian-build path. float32 is plenty for interaction
+        # energies quoted to two decimals and keeps the table at 64 KB.
+        self._energy: np.ndarray = np.zeros(
+            (ASCII_TABLE_SIZE, ASCII_TABLE_SIZE), dtype=np.float32
+        )
+        self._valid: np.ndarray = np.zeros(ASCII_TABLE_SIZE, dtype=bool)
+        self._valid_bytes: bytes | None = None
+
     @abstractmethod
     def get_energy(self, symbol_i: str, symbol_j: str) -> float:
         """Compute and return the interaction energy.
@@ -45,3 +74,125 @@ class Interaction(ABC):
 
         """
         pass
+
+    def get_energy_matrix(self, sequence: str) -> np.ndarray:
+        """Return pairwise interaction energies for a whole residue sequence.
+
+        Gathers the full N x N energy matrix from the ASCII-indexed lookup
+        table in one vectorized fancy-index instead of N^2 `get_energy` calls.
+
+        Args:
+            sequence (str): Sequence of one-letter residue symbols.
+
+        Returns:
+            np.ndarray: Matrix of shape (len(sequence), len(sequence)) where
+                entry (i, j) is the interaction energy of residues i and j.
+
+        Raises:
+            UnsupportedAminoAcidSymbolError: If any symbol in the sequence is not supported by the interaction model.
+
+        """
+        self._validate(sequence)
+
+        codes = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+        return self._energy[codes[:, None], codes[None, :]]
+
+    def _validate(self, sequence: str) -> None:
+        """Check all symbols of a sequence against the model in one sweep.
+
+        Deleting the valid symbol bytes from the encoded sequence leaves only
+        the offending characters, so the whole check is a single C-level
+        bytes.translate traversal.
+
+        Args:
+            sequence (str): Sequence of one-letter residue symbols.
+
+        Raises:
+            UnsupportedAminoAcidSymbolError: If any symbol in the sequence is not supported by the interaction model.
+
+        """
+        if self._valid_bytes is None:
+            self._valid_bytes = bytes(np.flatnonzero(self._valid).tolist())
+
+        try:
+            invalid: bytes = sequence.encode("ascii").translate(None, self._valid_bytes)
+        except UnicodeEncodeError:
+            invalid = b"?"
+
+        if invalid:
+            msg: str = f"Sequence '{sequence}' contains amino acid symbols not supported in loaded interaction model"
+            raise UnsupportedAminoAcidSymbolError(msg)
+
+    def specialize(self, sequence: str) -> tuple[np.ndarray, dict[str, int]]:
+        """Return a compact energy table specialized to one sequence's residues.
+
+        Partial evaluation for hot pair loops: the table covers only the k
+        distinct residues actually present, so pair energies become
+        `table[id_i, id_j]` with compact integer ids and no string handling.
+
+        Args:
+            sequence (str): Sequence of one-letter residue symbols.
+
+        Returns:
+            tuple[np.ndarray, dict[str, int]]: The (k, k) energy table and the
+                mapping from residue symbol to its row/column id.
+
+        Raises:
+            UnsupportedAminoAcidSymbolError: If any symbol in the sequence is not supported by the interaction model.
+
+        """
+        self._validate(sequence)
+
+        symbols: list[str] = sorted(set(sequence))
+        codes = np.frombuffer("".join(symbols).encode("ascii"), dtype=np.uint8)
+
+        symbol_to_id: dict[str, int] = {
+            symbol: index for index, symbol in enumerate(symbols)
+        }
+        return self._energy[np.ix_(codes, codes)], symbol_to_id
+
+    def _load_cached_tables(self) -> dict[str, np.ndarray] | None:
+        """Load the lookup tables from the binary cache next to the matrix file.
+
+        The cache is only used when it is at least as new as the source text
+        file, so editing the matrix transparently triggers a reparse.
+
+        Returns:
+            dict[str, np.ndarray] | None: Any extra subclass tables stored in
+                the cache, or None if the cache is missing or stale.
+
+        """
+        cache_path = self._interaction_matrix_path.with_suffix(".npz")
+        try:
+            if (
+                cache_path.stat().st_mtime
+                < self._interaction_matrix_path.stat().st_mtime
+            ):
+                return None
+            with np.load(cache_path) as data:
+                tables = {name: data[name] for name in data.files}
+            self._energy = tables.pop("energy")
+            self._valid = tables.pop("valid")
+        except (OSError, KeyError):
+            return None
+
+        self.valid_symbols = {
+            chr(code) for code in np.flatnonzero(self._valid).tolist()
+        }
+        logger.debug("Loaded interaction tables from cache at: %s", cache_path)
+        return tables
+
+    def _save_cached_tables(self, **extra_tables: np.ndarray) -> None:
+        """Write the lookup tables to a binary cache next to the matrix file.
+
+        Args:
+            **extra_tables (np.ndarray): Additional subclass arrays to store alongside the energy and validity tables.
+
+        """
+        cache_path = self._interaction_matrix_path.with_suffix(".npz")
+        try:
+            np.savez(cache_path, energy=self._energy, valid=self._valid, **extra_tables)
+        except OSError:
+            logger.warning("Could not write interaction table cache at: %s", cache_path)
+        else:
+            logger.debug("Wrote interaction table cache at: %s", cache_path)
@@ -4,8 +4,8 @@ This module provides a small utility class, ``MJInteraction``, that:
 
 - loads an MJ interaction matrix from a plain-text file,
 - records the set of valid residue symbols (one-letter codes), and
-- builds a dictionary that maps residue-residue pairs (e.g., "AL", "LA")
-  to their contact energies.
+- fills the shared ASCII-indexed float32 energy table with symmetric
+  residue-residue contact energies (both "AB" and "BA" orders).
 
 MJ matrix format assumptions
 -------------------------
@@ -18,8 +18,6 @@ present with the same energy.
 
 from pathlib import Path
 
-import numpy as np
-
 from constants import MJ_INTERACTION_MATRIX_FILEPATH
 from exceptions import UnsupportedAminoAcidSymbolError
 from interaction import Interaction
@@ -36,6 +34,8 @@ class MJInteraction(Interaction):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         interaction_matrix_path: Path = MJ_INTERACTION_MATRIX_FILEPATH,
@@ -52,11 +52,18 @@ class MJInteraction(Interaction):
         super().__init__(interaction_matrix_path)
         logger.debug("Initializing MJInteraction...")
 
-        self._energy_pairs: dict[str, float] = self._prepare_mj_interaction_matrix(
-            self._interaction_matrix_path
-        )
+        if self._load_cached_tables() is None:
+            energy_pairs: dict[str, float] = self._prepare_mj_interaction_matrix(
+                self._interaction_matrix_path
+            )
+
+            self.valid_symbols = {symbol for pair in energy_pairs for symbol in pair}
 
-        self.valid_symbols = {symbol for pair in self._energy_pairs for symbol in pair}
+            for pair, energy in energy_pairs.items():
+                self._energy[ord(pair[0]), ord(pair[1])] = energy
+            self._valid[[ord(symbol) for symbol in self.valid_symbols]] = True
+
+            self._save_cached_tables()
 
         logger.info(
             "MJInteraction initialized with %s valid amino acid symbols",
@@ -82,16 +89,20 @@ class MJInteraction(Interaction):
 
         """
         try:
-            mj_matrix = np.loadtxt(mj_filepath, dtype=str)
+            mj_matrix: list[list[str]] = [
+                line.split()
+                for line in mj_filepath.read_text().splitlines()
+                if line.strip()
+            ]
 
-            header = mj_matrix[0, :]
+            header = mj_matrix[0]
             energy_pairs: dict[str, float] = {}
 
-            for row in range(1, np.shape(mj_matrix)[0]):
+            for row in range(1, len(mj_matrix)):
                 row_symbol = header[row - 1]
-                for col in range(row - 1, np.shape(mj_matrix)[1]):
+                for col in range(row - 1, len(mj_matrix[row])):
                     col_symbol = header[col]
-                    energy = float(mj_matrix[row, col])
+                    energy = float(mj_matrix[row][col])
                     key = f"{col_symbol}{row_symbol}"
                     energy_pairs[key] = energy
                     energy_pairs[key[::-1]] = energy
@@ -120,11 +131,14 @@ class MJInteraction(Interaction):
             UnsupportedAminoAcidSymbolError: If either residue symbol is not in the MJ matrix.
 
         """
-        key = f"{symbol_i}{symbol_j}"
         try:
-            return self._energy_pairs[key]
-        except KeyError as e:
-            msg: str = (
-                f"Energy pair of '{key}' not supported in loaded MJ interaction model"
-            )
-            raise UnsupportedAminoAcidSymbolError(msg) from e
+            code_i, code_j = ord(symbol_i), ord(symbol_j)
+            supported = bool(self._valid[code_i] and self._valid[code_j])
+        except (TypeError, IndexError):
+            supported = False
+
+        if not supported:
+            msg: str = f"Energy pair of '{symbol_i}{symbol_j}' not supported in loaded MJ interaction model"
+            raise UnsupportedAminoAcidSymbolError(msg)
+
+        return float(self._energy[code_i, code_j])
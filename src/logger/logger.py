@@ -6,6 +6,7 @@ configured in a consistent way across the whole program.
 
 import logging
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING
 
 from constants import (
@@ -18,42 +19,58 @@ from constants import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+_FORMATTER = logging.Formatter(
+    "%(asctime)-19s [%(levelname)-5s] | %(module)-20s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-def get_logger(name: str = GLOBAL_LOGGER_NAME) -> logging.Logger:
-    """Creates and configures a logger instance.
+_FILE_HANDLER: logging.Handler | None = None
 
-    Args:
-        name (str): Name of the logger. Defaults to `GLOBAL_LOGGER_NAME`.
+
+def _get_file_handler() -> logging.Handler:
+    """Return the process-wide file handler, creating it on first use.
+
+    All loggers share one handler (and thus one timestamped log file and one
+    OS file descriptor) per process.
 
     Returns:
-        logging.Logger: Configured logger instance.
+        logging.Handler: Shared file handler writing to the timestamped log file.
 
     """
-    logger = logging.getLogger(name)
-    if not logger.hasHandlers():
+    global _FILE_HANDLER  # noqa: PLW0603
+    if _FILE_HANDLER is None:
+        LOGS_DIRPATH.mkdir(parents=True, exist_ok=True)
         timestamp: str = datetime.now(tz=DEFAULT_TIMEZONE).strftime(
             "%Y_%m_%d__%H_%M_%S"
         )
+        log_filepath: Path = LOGS_DIRPATH / f"{timestamp}.log"
+        _FILE_HANDLER = logging.FileHandler(log_filepath)
+        _FILE_HANDLER.setFormatter(_FORMATTER)
+    return _FILE_HANDLER
 
-        log_handlers: list[logging.Handler] = []
 
-        stream_handler: logging.Handler = logging.StreamHandler()
-        log_handlers.append(stream_handler)
+@cache
+def get_logger(name: str = GLOBAL_LOGGER_NAME) -> logging.Logger:
+    """Creates and configures a logger instance.
 
-        log_filepath: Path = LOGS_DIRPATH / f"{timestamp}.log"
-        LOGS_DIRPATH.mkdir(parents=True, exist_ok=True)
+    Repeated calls with the same name are served from a cache, so the
+    hasHandlers() parent-chain walk and handler setup run at most once per
+    process for each logger name.
 
-        file_handler: logging.Handler = logging.FileHandler(log_filepath)
-        log_handlers.append(file_handler)
+    Args:
+        name (str): Name of the logger. Defaults to `GLOBAL_LOGGER_NAME`.
 
-        formatter = logging.Formatter(
-            "%(asctime)-19s [%(levelname)-5s] | %(module)-20s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+    Returns:
+        logging.Logger: Configured logger instance.
+
+    """
+    logger = logging.getLogger(name)
+    if not logger.hasHandlers():
+        stream_handler: logging.Handler = logging.StreamHandler()
+        stream_handler.setFormatter(_FORMATTER)
+        logger.addHandler(stream_handler)
 
-        for handler in log_handlers:
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger.addHandler(_get_file_handler())
 
         logger.setLevel(LOGGER_DEFAULT_LEVEL)
         logger.info("Logger and handlers initialized")
@@ -1,13 +1,13 @@
 """Main execution script for the quantum protein folding workflow."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from constants import EMPTY_SIDECHAIN_PLACEHOLDER
 from logger import get_logger
 from utils.setup_utils import (
-    build_and_compress_hamiltonian,
+    prepare_compressed_hamiltonian,
     run_vqe_optimization,
-    setup_folding_system,
     setup_result_analysis,
     setup_vqe_optimization,
 )
@@ -31,17 +31,10 @@ def main() -> None:
     main_chain: str = "APRLRFY"
     side_chain: str = EMPTY_SIDECHAIN_PLACEHOLDER * len(main_chain)
 
-    protein, interaction, contact_map, distance_map = setup_folding_system(
+    protein, compressed_h = prepare_compressed_hamiltonian(
         main_chain=main_chain, side_chain=side_chain
     )
 
-    _, compressed_h = build_and_compress_hamiltonian(
-        protein=protein,
-        interaction=interaction,
-        contact_map=contact_map,
-        distance_map=distance_map,
-    )
-
     vqe, counts, values = setup_vqe_optimization(num_qubits=compressed_h.num_qubits)
 
     raw_results: SamplingMinimumEigensolverResult = run_vqe_optimization(
@@ -55,11 +48,18 @@ def main() -> None:
         vqe_energies=values,
     )
 
-    result_interpreter.dump_results_to_files()
+    # The file dump is I/O-bound and independent of rendering, so it overlaps
+    # with the visualizations. Rendering itself stays sequential in the main
+    # thread: the pyplot-backed visualizer is neither thread-safe nor
+    # picklable into worker processes.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        dump_future = executor.submit(result_interpreter.dump_results_to_files)
+
+        result_visualizer.visualize_3d()
+        result_visualizer.visualize_2d()
+        result_visualizer.generate_3d_gif()
 
-    result_visualizer.visualize_3d()
-    result_visualizer.visualize_2d()
-    result_visualizer.generate_3d_gif()
+        dump_future.result()
 
 
 if __name__ == "__main__":
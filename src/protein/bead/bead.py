@@ -23,6 +23,10 @@ if TYPE_CHECKING:
 
 logger = get_logger()
 
+# Sublattice assignment only depends on index parity, so both enum members
+# are resolved once here instead of per bead.
+_SUBLATTICE_BY_PARITY: tuple[SubLattice, SubLattice] = (SubLattice.A, SubLattice.B)
+
 
 class Bead(ABC):
     """An abstract class defining a bead of a peptide.
@@ -35,6 +39,16 @@ class Bead(ABC):
 
     """
 
+    __slots__ = (
+        "_full_identity",
+        "_has_turn_qubits",
+        "_num_turn_qubits",
+        "index",
+        "sublattice",
+        "symbol",
+        "turn_qubits",
+    )
+
     def __init__(self, symbol: str, index: int, parent_chain_len: int) -> None:
         """Initialize a bead instance.
 
@@ -49,16 +63,17 @@ class Bead(ABC):
         self.symbol: str = symbol
         self.index: int = index
         self.turn_qubits: tuple[SparsePauliOp, ...] = ()
-        self.sublattice: SubLattice = SubLattice.B if index % 2 == 1 else SubLattice.A
+        self.sublattice: SubLattice = _SUBLATTICE_BY_PARITY[index & 1]
 
         self._num_turn_qubits: int = (parent_chain_len - 1) * QUBITS_PER_TURN
         self._has_turn_qubits: bool = index != (parent_chain_len - 1)
 
-        self._full_identity: SparsePauliOp = build_identity_op(
-            num_qubits=self._num_turn_qubits
-        )
-
+        # The identity is only needed alongside turn qubits, so the last bead
+        # in a chain skips the (cached) identity construction entirely.
         if self._has_turn_qubits:
+            self._full_identity: SparsePauliOp = build_identity_op(
+                num_qubits=self._num_turn_qubits
+            )
             self._initialize_turn_qubits()
         else:
             logger.info(
@@ -110,24 +125,25 @@ class Bead(ABC):
         """
         if not self.turn_qubits or not self._has_turn_qubits:
             return None
-        return (self.turn_0(), self.turn_1(), self.turn_2(), self.turn_3())
+        return self.turns()
 
     @abstractmethod
+    def turns(self) -> tuple[SparsePauliOp, ...]:
+        """Return the Pauli operators for all four turn directions at once."""
+        pass
+
     def turn_0(self) -> SparsePauliOp:
         """Return Pauli operator representing turn in direction 0."""
-        pass
+        return self.turns()[0]
 
-    @abstractmethod
     def turn_1(self) -> SparsePauliOp:
         """Return Pauli operator representing turn in direction 1."""
-        pass
+        return self.turns()[1]
 
-    @abstractmethod
     def turn_2(self) -> SparsePauliOp:
         """Return Pauli operator representing turn in direction 2."""
-        pass
+        return self.turns()[2]
 
-    @abstractmethod
     def turn_3(self) -> SparsePauliOp:
         """Return Pauli operator representing turn in direction 3."""
-        pass
+        return self.turns()[3]
@@ -2,7 +2,7 @@
 
 from qiskit.quantum_info import SparsePauliOp
 
-from constants import CONFORMATION_ENCODING
+from constants import CONFORMATION_ENCODING, NORM_FACTOR, QUBITS_PER_TURN
 from enums import ConformationEncoding
 from exceptions import ConformationEncodingError
 from protein.bead import Bead
@@ -11,6 +11,8 @@ from protein.bead import Bead
 class _MainBead(Bead):
     """Represents a main bead in the protein's backbone."""
 
+    __slots__ = ("_turns",)
+
     def __init__(self, symbol: str, index: int, parent_chain_len: int) -> None:
         """Initialize the main bead and set up its turn qubits.
 
@@ -19,72 +21,69 @@ class _MainBead(Bead):
             index (int): Position of the bead in the chain.
             parent_chain_len (int): Total number of beads in the parent chain.
 
-        """
-        super().__init__(symbol=symbol, index=index, parent_chain_len=parent_chain_len)
-
-    def turn_0(self) -> SparsePauliOp:
-        """Return the Pauli operator for the turn in direction 0.
-
-        Returns:
-            SparsePauliOp: Pauli operator representing direction 0.
-
         Raises:
             ConformationEncodingError: If the conformation encoding is invalid.
 
         """
-        if CONFORMATION_ENCODING == ConformationEncoding.SPARSE:
-            return self.turn_qubits[0]
-        if CONFORMATION_ENCODING == ConformationEncoding.DENSE:
-            return self._dense_turn_fun_0()
-        raise ConformationEncodingError
+        super().__init__(symbol=symbol, index=index, parent_chain_len=parent_chain_len)
 
-    def turn_1(self) -> SparsePauliOp:
-        """Return the Pauli operator for the turn in direction 1.
+        # The encoding is fixed for the whole run, so the four directional
+        # operators are resolved once here; turn_0..turn_3 then index a tuple
+        # instead of re-checking the encoding on every call.
+        self._turns: tuple[SparsePauliOp, ...] = ()
+        if self._has_turn_qubits:
+            if CONFORMATION_ENCODING == ConformationEncoding.SPARSE:
+                self._turns = self.turn_qubits[:4]
+            elif CONFORMATION_ENCODING == ConformationEncoding.DENSE:
+                self._turns = (
+                    self._dense_turn_fun_0(),
+                    self._dense_turn_fun_1(),
+                    self._dense_turn_fun_2(),
+                    self._dense_turn_fun_3(),
+                )
+            else:
+                raise ConformationEncodingError
+
+    def turns(self) -> tuple[SparsePauliOp, ...]:
+        """Return the Pauli operators for all four turn directions at once.
 
         Returns:
-            SparsePauliOp: Pauli operator representing direction 1.
-
-        Raises:
-            ConformationEncodingError: If the conformation encoding is invalid.
+            tuple[SparsePauliOp, ...]: Precomputed operators for directions 0-3.
 
         """
-        if CONFORMATION_ENCODING == ConformationEncoding.SPARSE:
-            return self.turn_qubits[1]
-        if CONFORMATION_ENCODING == ConformationEncoding.DENSE:
-            return self._dense_turn_fun_1()
-        raise ConformationEncodingError
+        return self._turns
 
-    def turn_2(self) -> SparsePauliOp:
-        """Return the Pauli operator for the turn in direction 2.
+    def _build_dense_turn(self, sign_a: float, sign_b: float) -> SparsePauliOp:
+        """Build a dense encoding operator directly from its four known terms.
 
-        Returns:
-            SparsePauliOp: Pauli operator representing direction 2.
-
-        Raises:
-            ConformationEncodingError: If the conformation encoding is invalid.
-
-        """
-        if CONFORMATION_ENCODING == ConformationEncoding.SPARSE:
-            return self.turn_qubits[2]
-        if CONFORMATION_ENCODING == ConformationEncoding.DENSE:
-            return self._dense_turn_fun_2()
-        raise ConformationEncodingError
+        With turn qubits of the projector form NORM_FACTOR * (I - Z), each
+        dense direction expands algebraically to
+        ``0.25 * (I ± Z_a ± Z_b ± Z_a Z_b)`` on the bead's qubit pair, so the
+        operator is assembled from a sparse term list instead of composing and
+        simplifying SparsePauliOp products. The terms are already canonical,
+        so no simplify pass is needed.
 
-    def turn_3(self) -> SparsePauliOp:
-        """Return the Pauli operator for the turn in direction 3.
+        Args:
+            sign_a (float): Sign of the Z term on the bead's first turn qubit.
+            sign_b (float): Sign of the Z term on the bead's second turn qubit.
 
         Returns:
-            SparsePauliOp: Pauli operator representing direction 3.
-
-        Raises:
-            ConformationEncodingError: If the conformation encoding is invalid.
+            SparsePauliOp: Dense-encoded Pauli operator for one direction.
 
         """
-        if CONFORMATION_ENCODING == ConformationEncoding.SPARSE:
-            return self.turn_qubits[3]
-        if CONFORMATION_ENCODING == ConformationEncoding.DENSE:
-            return self._dense_turn_fun_3()
-        raise ConformationEncodingError
+        z_a: int = QUBITS_PER_TURN * self.index
+        z_b: int = z_a + 1
+        scale: float = NORM_FACTOR * NORM_FACTOR
+
+        return SparsePauliOp.from_sparse_list(
+            [
+                ("", [], scale),
+                ("Z", [z_a], sign_a * scale),
+                ("Z", [z_b], sign_b * scale),
+                ("ZZ", [z_a, z_b], sign_a * sign_b * scale),
+            ],
+            num_qubits=self._num_turn_qubits,
+        )
 
     def _dense_turn_fun_0(self) -> SparsePauliOp:
         """Compute the dense encoding operator for direction 0.
@@ -93,10 +92,7 @@ class _MainBead(Bead):
             SparsePauliOp: Dense-encoded Pauli operator for direction 0.
 
         """
-        return (
-            (self._full_identity - self.turn_qubits[0])
-            @ (self._full_identity - self.turn_qubits[1])
-        ).simplify()
+        return self._build_dense_turn(1.0, 1.0)
 
     def _dense_turn_fun_1(self) -> SparsePauliOp:
         """Compute the dense encoding operator for direction 1.
@@ -105,9 +101,7 @@ class _MainBead(Bead):
             SparsePauliOp: Dense-encoded Pauli operator for direction 1.
 
         """
-        return (
-            self.turn_qubits[1] @ (self.turn_qubits[1] - self.turn_qubits[0])
-        ).simplify()
+        return self._build_dense_turn(1.0, -1.0)
 
     def _dense_turn_fun_2(self) -> SparsePauliOp:
         """Compute the dense encoding operator for direction 2.
@@ -116,9 +110,7 @@ class _MainBead(Bead):
             SparsePauliOp: Dense-encoded Pauli operator for direction 2.
 
         """
-        return (
-            self.turn_qubits[0] @ (self.turn_qubits[0] - self.turn_qubits[1])
-        ).simplify()
+        return self._build_dense_turn(-1.0, 1.0)
 
     def _dense_turn_fun_3(self) -> SparsePauliOp:
         """Compute the dense encoding operator for direction 3.
@@ -127,4 +119,4 @@ class _MainBead(Bead):
             SparsePauliOp: Dense-encoded Pauli operator for direction 3.
 
         """
-        return (self.turn_qubits[0] @ self.turn_qubits[1]).simplify()
+        return self._build_dense_turn(-1.0, -1.0)
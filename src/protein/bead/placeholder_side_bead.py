@@ -8,6 +8,18 @@ from protein.bead import Bead
 logger = get_logger()
 
 
+def _raise_no_turn_qubits() -> tuple[SparsePauliOp, ...]:
+    """Raise for any turn operator access on a placeholder side bead.
+
+    Raises:
+        NotImplementedError: Always raised since placeholder side beads do not have turn qubits.
+
+    """
+    msg: str = "Placeholder side bead has no turn qubit operators."
+    logger.error(msg)
+    raise NotImplementedError(msg)
+
+
 class _PlaceholderSideBead(Bead):
     """Represents a empty side bead - not attached to a protein's main chain, used as a placeholder for storing empty symbols and padding.
 
@@ -18,6 +30,8 @@ class _PlaceholderSideBead(Bead):
 
     """
 
+    __slots__ = ("parent_chain_len",)
+
     def __init__(self, symbol: str, index: int, parent_chain_len: int) -> None:
         """Initialize the placeholder side bead.
 
@@ -36,46 +50,6 @@ class _PlaceholderSideBead(Bead):
         self.index = index
         self.parent_chain_len = parent_chain_len
 
-    def turn_0(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 0.
-
-        Raises:
-            NotImplementedError: Always raised since placeholder side beads do not have turn qubits.
-
-        """
-        msg: str = "Placeholder side bead has no turn qubit operators."
-        logger.error(msg)
-        raise NotImplementedError(msg)
-
-    def turn_1(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 1.
-
-        Raises:
-            NotImplementedError: Always raised since placeholder side beads do not have turn qubits.
-
-        """
-        msg: str = "Placeholder side bead has no turn qubit operators."
-        logger.error(msg)
-        raise NotImplementedError(msg)
-
-    def turn_2(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 2.
-
-        Raises:
-            NotImplementedError: Always raised since placeholder side beads do not have turn qubits.
-
-        """
-        msg: str = "Placeholder side bead has no turn qubit operators."
-        logger.error(msg)
-        raise NotImplementedError(msg)
-
-    def turn_3(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 3.
-
-        Raises:
-            NotImplementedError: Always raised since placeholder side beads do not have turn qubits.
-
-        """
-        msg: str = "Placeholder side bead has no turn qubit operators."
-        logger.error(msg)
-        raise NotImplementedError(msg)
+    # Every turn access funnels through turns(), so one module-level raiser
+    # covers all four directions.
+    turns = staticmethod(_raise_no_turn_qubits)
@@ -8,9 +8,23 @@ from protein.bead import Bead
 logger = get_logger()
 
 
+def _raise_not_implemented() -> tuple[SparsePauliOp, ...]:
+    """Raise for any turn operator access on a side bead.
+
+    Raises:
+        NotImplementedError: Always raised since side bead turns are not implemented.
+
+    """
+    msg: str = "Side beads are not yet implemented!"
+    logger.error(msg)
+    raise NotImplementedError(msg)
+
+
 class _SideBead(Bead):
     """Represents a side bead attached to a protein's main chain."""
 
+    __slots__ = ()
+
     def __init__(self, _symbol: str, _index: int, _parent_chain_len: int) -> None:
         """Initialize a side bead with its symbol and position in the chain.
 
@@ -24,46 +38,6 @@ class _SideBead(Bead):
         logger.error(_msg)
         raise NotImplementedError(_msg)
 
-    def turn_0(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 0.
-
-        Raises:
-            NotImplementedError: Always raised since side bead turns are not implemented.
-
-        """
-        _msg: str = "Side beads are not yet implemented!"
-        logger.error(_msg)
-        raise NotImplementedError(_msg)
-
-    def turn_1(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 1.
-
-        Raises:
-            NotImplementedError: Always raised since side bead turns are not implemented.
-
-        """
-        _msg: str = "Side beads are not yet implemented!"
-        logger.error(_msg)
-        raise NotImplementedError(_msg)
-
-    def turn_2(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 2.
-
-        Raises:
-            NotImplementedError: Always raised since side bead turns are not implemented.
-
-        """
-        _msg: str = "Side beads are not yet implemented!"
-        logger.error(_msg)
-        raise NotImplementedError(_msg)
-
-    def turn_3(self) -> SparsePauliOp:
-        """Return the Pauli operator for a turn in direction 3.
-
-        Raises:
-            NotImplementedError: Always raised since side bead turns are not implemented.
-
-        """
-        _msg: str = "Side beads are not yet implemented!"
-        logger.error(_msg)
-        raise NotImplementedError(_msg)
+    # Every turn access funnels through turns(), so one module-level raiser
+    # covers all four directions.
+    turns = staticmethod(_raise_not_implemented)
@@ -15,10 +15,12 @@ class Chain(ABC):
     """Abstract base class for protein chains, defining shared behavior for all chain types.
 
     Attributes:
-        beads (list[Bead]): List of beads comprising the protein chain.
+        beads (tuple[Bead, ...]): Beads comprising the protein chain.
 
     """
 
+    __slots__ = ("_sequence", "beads")
+
     def __init__(self, protein_sequence: str) -> None:
         """Initialize the chain with an empty list of beads.
 
@@ -26,11 +28,17 @@ class Chain(ABC):
             protein_sequence (str): The amino acid sequence representing the protein chain.
 
         """
-        self.beads: list[Bead] = []
+        self.beads: tuple[Bead, ...] = ()
+        # The beads never change after construction, so the chain's string
+        # form is just the sequence it was built from.
+        self._sequence: str = protein_sequence
         self._initialize_beads(protein_sequence)
         if not self.beads:
             msg: str = "Bead initialization failed; beads list is empty."
             raise ValueError(msg)
+        # Chains are read-only after construction; a tuple is smaller, faster
+        # to iterate, and makes that immutability explicit.
+        self.beads = tuple(self.beads)
 
     @abstractmethod
     def _initialize_beads(self, protein_sequence: str) -> None:
@@ -93,4 +101,4 @@ class Chain(ABC):
             str: Concatenated sequence of bead symbols.
 
         """
-        return "".join(bead.symbol for bead in self.beads)
+        return self._sequence
@@ -11,10 +11,12 @@ class _MainChain(Chain):
     """Represents the main chain of a protein, a linear sequence of amino acids forming its backbone.
 
     Attributes:
-        beads (list[_MainBead]): List of main beads in the protein's backbone.
+        beads (tuple[_MainBead, ...]): Main beads in the protein's backbone.
 
     """
 
+    __slots__ = ()
+
     def __init__(self, protein_sequence: str) -> None:
         """Initialize the main chain with beads corresponding to the protein sequence.
 
@@ -35,14 +37,14 @@ class _MainChain(Chain):
             protein_sequence (str): The amino acid sequence representing the protein chain.
 
         """
-        self.beads = [
+        self.beads = tuple(
             _MainBead(
                 symbol=bead,
                 index=index,
                 parent_chain_len=len(protein_sequence),
             )
             for index, bead in enumerate(protein_sequence)
-        ]
+        )
 
         logger.info(
             "MainChain for %s initialized with %d MainBeads.",
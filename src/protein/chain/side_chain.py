@@ -13,10 +13,12 @@ class _SideChain(Chain):
     """Represents the side chain of a protein, consisting of amino acids attached to residues of the main chain.
 
     Attributes:
-        beads (list[_SideBead | _PlaceholderSideBead]): List of side beads in the protein's side chain.
+        beads (tuple[_SideBead | _PlaceholderSideBead, ...]): Side beads in the protein's side chain.
 
     """
 
+    __slots__ = ()
+
     def __init__(self, protein_sequence: str) -> None:
         """Initialize the side chain with beads corresponding to the protein sequence.
 
@@ -38,24 +40,29 @@ class _SideChain(Chain):
             protein_sequence (str): The amino acid sequence representing the protein chain.
 
         """
-        self.beads = [
-            _SideBead(
-                _symbol=bead,
-                _index=index,
-                _parent_chain_len=len(protein_sequence),
-            )
-            if bead != EMPTY_SIDECHAIN_PLACEHOLDER
-            else _PlaceholderSideBead(
-                symbol=bead,
-                index=index,
-                parent_chain_len=len(protein_sequence),
-            )
-            for index, bead in enumerate(protein_sequence)
-        ]
-
-        side_bead_count: int = len(
-            [bead for bead in self.beads if not isinstance(bead, _PlaceholderSideBead)]
-        )
+        # Beads are counted as they are created, avoiding a second pass of
+        # isinstance checks over the finished collection.
+        beads: list[_SideBead | _PlaceholderSideBead] = []
+        side_bead_count: int = 0
+        for index, bead in enumerate(protein_sequence):
+            if bead != EMPTY_SIDECHAIN_PLACEHOLDER:
+                beads.append(
+                    _SideBead(
+                        _symbol=bead,
+                        _index=index,
+                        _parent_chain_len=len(protein_sequence),
+                    )
+                )
+                side_bead_count += 1
+            else:
+                beads.append(
+                    _PlaceholderSideBead(
+                        symbol=bead,
+                        index=index,
+                        parent_chain_len=len(protein_sequence),
+                    )
+                )
+        self.beads = tuple(beads)
         placeholder_bead_count: int = len(self.beads) - side_bead_count
 
         logger.info(
@@ -1,13 +1,88 @@
 """Defines the `Protein` class, representing proteins with main and side chains, including sequence validation and chain initialization."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from constants import EMPTY_SIDECHAIN_PLACEHOLDER, MIN_CHAIN_LENGTH
 from exceptions import ChainLengthError, UnsupportedAminoAcidSymbolError
 from logger import get_logger
 from protein.chain import _MainChain, _SideChain
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 logger = get_logger()
 
 
+@lru_cache(maxsize=128)
+def _build_main_chain(protein_sequence: str) -> _MainChain:
+    """Builds (or returns the cached) main chain for a sequence.
+
+    Chains are read-only after construction, so repeated Protein builds for
+    the same sequence share one chain instead of re-creating every bead and
+    its turn operators.
+
+    Args:
+        protein_sequence (str): Amino acid sequence of the protein backbone.
+
+    Returns:
+        _MainChain: Main chain for the sequence.
+
+    """
+    return _MainChain(protein_sequence)
+
+
+@lru_cache(maxsize=128)
+def _build_side_chain(protein_sequence: str) -> _SideChain:
+    """Builds (or returns the cached) side chain for a sequence.
+
+    Args:
+        protein_sequence (str): Amino acid sequence of the protein side chain.
+
+    Returns:
+        _SideChain: Side chain for the sequence.
+
+    """
+    return _SideChain(protein_sequence)
+
+
+@dataclass(frozen=True)
+class ProteinGeometry:
+    """Precomputed geometry of a protein's main chain, shared between maps.
+
+    Both the contact map and the distance map enumerate the same main-chain
+    bead pairs; computing the enumeration data once here avoids each map
+    re-deriving it from the bead objects.
+
+    Attributes:
+        main_chain_len (int): Number of beads in the main chain.
+        sublattices (NDArray[np.int8]): Sublattice value per main-chain bead.
+
+    """
+
+    main_chain_len: int
+    sublattices: NDArray[np.int8]
+
+    def bead_pairs(
+        self, min_separation: int
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Return index arrays of all (lower, upper) main-chain bead pairs.
+
+        Args:
+            min_separation (int): Minimum index separation between the beads of a pair.
+
+        Returns:
+            tuple[NDArray[np.int64], NDArray[np.int64]]: Lower and upper bead index arrays.
+
+        """
+        return np.triu_indices(self.main_chain_len, k=min_separation)
+
+
 class Protein:
     """Represents a protein with main and side chains.
 
@@ -41,17 +116,14 @@ class Protein:
             ChainLengthError: If main and side chain sequences are not of the same length.
 
         """
-        concatenated_sequence_symbols: set[str] = set(
-            main_protein_sequence
-            + side_protein_sequence.replace(EMPTY_SIDECHAIN_PLACEHOLDER, "")
+        # One C-level set difference replaces the membership scan and the
+        # follow-up comprehension that re-derived the offending symbols.
+        invalid_symbols: set[str] = (
+            set(main_protein_sequence).union(side_protein_sequence)
+            - {EMPTY_SIDECHAIN_PLACEHOLDER}
+            - valid_symbols
         )
-
-        if not all(symbol in valid_symbols for symbol in concatenated_sequence_symbols):
-            invalid_symbols: set[str] = {
-                symbol
-                for symbol in concatenated_sequence_symbols
-                if symbol not in valid_symbols
-            }
+        if invalid_symbols:
             msg: str = f"Protein contains unsupported amino acid symbols: {', '.join(invalid_symbols)}"
             raise UnsupportedAminoAcidSymbolError(msg)
 
@@ -66,5 +138,17 @@ class Protein:
             msg: str = f"Main and side protein sequences must have at least {MIN_CHAIN_LENGTH} residues."
             raise ChainLengthError(msg)
 
-        self.main_chain: _MainChain = _MainChain(main_protein_sequence)
-        self.side_chain: _SideChain = _SideChain(side_protein_sequence)
+        self.main_chain: _MainChain = _build_main_chain(main_protein_sequence)
+        self.side_chain: _SideChain = _build_side_chain(side_protein_sequence)
+
+    @cached_property
+    def geometry(self) -> ProteinGeometry:
+        """ProteinGeometry: Lazily built geometry shared by contact and distance maps."""
+        return ProteinGeometry(
+            main_chain_len=len(self.main_chain),
+            sublattices=np.fromiter(
+                (bead.sublattice for bead in self.main_chain),
+                dtype=np.int8,
+                count=len(self.main_chain),
+            ),
+        )
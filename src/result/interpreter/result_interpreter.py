@@ -99,6 +99,31 @@ class ResultInterpreter:
         else:
             raise ConformationEncodingError
 
+        # Lookup table from the integer value of a QUBITS_PER_TURN bit pattern
+        # to its turn direction (-1 marks patterns outside the encoding), so
+        # bitstrings decode in one vectorized pass instead of per-chunk dict
+        # lookups.
+        self._turn_value_lut: NDArray[np.int64] = np.full(
+            2**QUBITS_PER_TURN, -1, dtype=np.int64
+        )
+        for direction, indicator in self._turn_encoding.items():
+            self._turn_value_lut[int(indicator, 2)] = direction.value
+
+        # The target length only depends on the chain and encoding, so it is
+        # computed once here instead of per consumer.
+        self._target_main_chain_bits: int = (
+            self._get_target_sequence_length_main_chain()
+        )
+
+        # Candidate (i, j) main-main contact pairs in interaction-bit order:
+        # separation of at least 5 with matching parity. Precomputing the
+        # table lets the contact scan become a boolean mask over it.
+        num_beads: int = len(self._protein.main_chain)
+        self._contact_pair_table: NDArray[np.int32] = np.array(
+            [(i, j) for i in range(num_beads - 5) for j in range(i + 5, num_beads, 2)],
+            dtype=np.int32,
+        ).reshape(-1, 2)
+
         self._vqe_output: SparseVQEOutput = self._interpret_raw_vqe_results()
 
         # Note - the sole reason for the bitstring here to be passed explicitly, is to ensure that we have a single
@@ -131,36 +156,31 @@ class ResultInterpreter:
         logger.debug("Finding main-main contacts from interaction bits...")
 
         raw_bitstring: str = self._vqe_output.bitstring
-        num_beads: int = len(self._protein.main_chain)
+        interaction_bits: str = raw_bitstring[: -self._target_main_chain_bits]
 
-        num_shape_qubits: int = self._get_target_sequence_length_main_chain()
-        interaction_bits: str = raw_bitstring[:-num_shape_qubits]
-
-        contacts: dict[int, int] = {}
-        qubit_index: int = 0
-
-        for i in range(num_beads - 5):
-            for j in range(i + 5, num_beads, 2):
-                if qubit_index >= len(interaction_bits):
-                    logger.warning(
-                        "Ran out of interaction bits while checking pair (%s, %s). Expected more bits.",
-                        i,
-                        j,
-                    )
-                    break
-                if interaction_bits[qubit_index] == "1":
-                    contacts[i] = j
-
-                qubit_index += 1
-            if qubit_index >= len(interaction_bits):
-                break
-
-        if qubit_index < len(interaction_bits):
+        num_pairs: int = len(self._contact_pair_table)
+        if len(interaction_bits) < num_pairs:
+            logger.warning(
+                "Ran out of interaction bits after %s of %s candidate pairs. Expected more bits.",
+                len(interaction_bits),
+                num_pairs,
+            )
+        elif len(interaction_bits) > num_pairs:
             logger.warning(
                 "Finished checking all pairs, but %s interaction bits were left over.",
-                len(interaction_bits) - qubit_index,
+                len(interaction_bits) - num_pairs,
             )
-        return contacts
+
+        set_bits: NDArray[np.bool] = np.frombuffer(
+            interaction_bits.encode("ascii"), dtype=np.uint8
+        )[:num_pairs] == ord("1")
+        detected: NDArray[np.int32] = self._contact_pair_table[: len(set_bits)][
+            set_bits
+        ]
+
+        # Later pairs overwrite earlier ones for the same lower bead, matching
+        # the scan order of the candidate table.
+        return {int(i): int(j) for i, j in detected.tolist()}
 
     def _log_turn_sequence(self) -> None:
         """Logs the decoded turn sequence."""
@@ -280,7 +300,7 @@ class ResultInterpreter:
         """
         logger.debug("Preprocessing bitstring for turn sequence decoding...")
 
-        target_bitstring_length: int = self._get_target_sequence_length_main_chain()
+        target_bitstring_length: int = self._target_main_chain_bits
 
         result_bitstring: str = bitstring[-target_bitstring_length:]
 
@@ -337,6 +357,48 @@ class ResultInterpreter:
 
         return target_length
 
+    def _decode_turn_indices(self, bitstring: str) -> NDArray[np.int64]:
+        """Decodes a processed bitstring into an array of turn direction indices.
+
+        The bitstring is viewed as a byte array, reshaped into chunks of
+        QUBITS_PER_TURN bits, and each chunk's integer value is resolved
+        through the precomputed turn lookup table in a single vectorized pass.
+
+        Args:
+            bitstring (str): The processed bitstring to decode.
+
+        Returns:
+            NDArray[np.int64]: Turn direction indices, one per turn.
+
+        Raises:
+            ConformationEncodingError: If any chunk is not a valid turn encoding.
+
+        """
+        bits: NDArray[np.int64] = np.frombuffer(
+            bitstring.encode("ascii"), dtype=np.uint8
+        ).astype(np.int64) - ord("0")
+
+        turns_length: int = len(bitstring) // QUBITS_PER_TURN
+        chunks: NDArray[np.int64] = bits[: turns_length * QUBITS_PER_TURN].reshape(
+            turns_length, QUBITS_PER_TURN
+        )
+
+        weights: NDArray[np.int64] = 1 << np.arange(
+            QUBITS_PER_TURN - 1, -1, -1, dtype=np.int64
+        )
+        indices: NDArray[np.int64] = self._turn_value_lut[chunks @ weights]
+
+        if np.any(indices < 0):
+            invalid_chunk_idx: int = int(np.argmax(indices < 0))
+            invalid_chunk: str = bitstring[
+                invalid_chunk_idx * QUBITS_PER_TURN : (invalid_chunk_idx + 1)
+                * QUBITS_PER_TURN
+            ]
+            msg: str = f"Unknown turn encoding for: {invalid_chunk}"
+            raise ConformationEncodingError(msg)
+
+        return indices
+
     def _generate_turn_sequence(
         self,
     ) -> list[TurnDirection]:
@@ -350,24 +412,10 @@ class ResultInterpreter:
 
         """
         logger.debug("Generating turn sequence from processed bitstring...")
-        turns_length = len(self._processed_bitstring) // QUBITS_PER_TURN
-        turns = [
-            self._processed_bitstring[i * QUBITS_PER_TURN : (i + 1) * QUBITS_PER_TURN]
-            for i in range(turns_length)
-        ]
-
-        bitstring_to_direction = {
-            bitstring: direction for direction, bitstring in self._turn_encoding.items()
-        }
-
-        turn_sequence: list[TurnDirection] = []
-        for turn in turns:
-            if turn not in bitstring_to_direction:
-                msg: str = f"Unknown turn encoding for: {turn}"
-                raise ConformationEncodingError(msg)
-            turn_sequence.append(bitstring_to_direction[turn])
-
-        return turn_sequence
+        indices: NDArray[np.int64] = self._decode_turn_indices(
+            self._processed_bitstring
+        )
+        return [TurnDirection(index) for index in indices.tolist()]
 
     def _generate_3d_coordinates(self) -> list[BeadPosition]:
         """Generates the coordinates for the beads in the main chain in 3D tetrahedral lattice.
@@ -388,35 +436,29 @@ class ResultInterpreter:
 
         tetrahedral_basis_vector /= np.linalg.norm(tetrahedral_basis_vector[0])
 
-        bitstring_to_direction: dict[str, int] = {
-            bitstring: direction.value
-            for direction, bitstring in self._turn_encoding.items()
-        }
-
-        turns_length: int = len(self._processed_bitstring) // QUBITS_PER_TURN
-        turns: list[str] = [
-            self._processed_bitstring[i * QUBITS_PER_TURN : (i + 1) * QUBITS_PER_TURN]
-            for i in range(turns_length)
+        # The walk is a prefix sum over per-turn steps: gather the basis row
+        # of each decoded turn, flip signs on alternating sublattices, and
+        # cumulatively sum - all in one vectorized pass instead of a Python
+        # loop over turns.
+        indices: NDArray[np.int64] = self._decode_turn_indices(
+            self._processed_bitstring
+        )
+        signs: NDArray[np.float64] = np.where(np.arange(len(indices)) & 1, -1.0, 1.0)[
+            :, None
         ]
+        steps: NDArray[np.float64] = tetrahedral_basis_vector[indices] * signs
+        positions: NDArray[np.float64] = np.vstack(
+            [np.zeros((1, 3)), np.cumsum(steps, axis=0)]
+        )
 
         main_chain_symbols = [bead.symbol for bead in self._protein.main_chain.beads]
 
-        current_pos = np.zeros(3)
-        coords = [BeadPosition(0, main_chain_symbols[0], *current_pos)]
-
-        for i, (turn, symbol) in enumerate(
-            zip(turns, main_chain_symbols[1:], strict=True)
-        ):
-            if turn not in bitstring_to_direction:
-                msg: str = f"Unknown turn encoding for: {turn}"
-                raise ConformationEncodingError(msg)
-
-            dir_idx = bitstring_to_direction[turn]
-            direction_vec = ((-1) ** i) * tetrahedral_basis_vector[dir_idx]
-            current_pos = current_pos + direction_vec
-            coords.append(BeadPosition(len(coords), symbol, *current_pos))
-
-        return coords
+        return [
+            BeadPosition(index, symbol, *position)
+            for index, (symbol, position) in enumerate(
+                zip(main_chain_symbols, positions.tolist(), strict=True)
+            )
+        ]
 
     def dump_results_to_files(self) -> None:
         """Dumps the interpreted results to output files in the specified directory."""
@@ -445,13 +487,17 @@ class ResultInterpreter:
 
         idx_width: int = len(ITERATION_COLNAME)
         try:
-            with vqe_iterations_filepath.open("w", encoding="utf-8") as f:
-                f.write(f"{ITERATION_COLNAME} | Energy\n")
-                for iteration, energy in zip(
-                    self._vqe_iterations, self._vqe_energies, strict=True
-                ):
-                    placeholder = " " if energy >= 0 else ""
-                    f.write(f"{iteration:^{idx_width}} | {placeholder}{energy:.16f}\n")
+            # Build all rows in memory and flush them in one buffered write
+            # instead of issuing one small write per iteration.
+            lines: list[str] = [f"{ITERATION_COLNAME} | Energy"]
+            for iteration, energy in zip(
+                self._vqe_iterations, self._vqe_energies, strict=True
+            ):
+                placeholder = " " if energy >= 0 else ""
+                lines.append(f"{iteration:^{idx_width}} | {placeholder}{energy:.16f}")
+            vqe_iterations_filepath.write_text(
+                "\n".join(lines) + "\n", encoding="utf-8"
+            )
         except Exception:
             logger.exception("Error dumping VQE iterations to file")
             raise
@@ -477,8 +523,12 @@ class ResultInterpreter:
 
         try:
             results_data = sanitize_for_json(results_dict)
-            with results_filepath.open("w", encoding="utf-8") as f:
-                json.dump(results_data, f, indent=2, ensure_ascii=False)
+            # Serialize to a string first so the file is written in a single
+            # sweep rather than through json.dump's chunked writes.
+            results_filepath.write_text(
+                json.dumps(results_data, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
         except Exception:
             logger.exception("Error sanitizing results for JSON")
             raise
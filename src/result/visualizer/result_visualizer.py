@@ -7,10 +7,18 @@ the folded protein structure.
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+if os.environ.get("QFOLD_HEADLESS"):
+    # Select the non-interactive Agg backend before pyplot is first imported,
+    # so batch runs never spin up a GUI event loop. Setting the environment
+    # variable (instead of calling matplotlib.use) keeps matplotlib itself
+    # out of the import path until a visualization method actually runs.
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
 from constants import (
     CONFORMATION_ENCODING,
     FCC_EDGE_LENGTH,
@@ -61,6 +69,13 @@ class ResultVisualizer:
         self._coordinates_3d: list[BeadPosition] = coordinates_3d
         self._main_main_contacts_detected: dict[int, int] = main_main_contacts_detected
 
+        # Materialize the coordinate array and symbol list once; every
+        # visualization method used to rebuild them from the BeadPosition list.
+        self._coords: NDArray[np.float64] = np.array(
+            [(b.x, b.y, b.z) for b in coordinates_3d]
+        )
+        self._symbols: list[str] = [b.symbol for b in coordinates_3d]
+
     def visualize_3d(self, filename: str = HTML_VISUALIZATION_FILENAME) -> None:
         """Generate interactive 3D visualization of the resulting conformation in the .html file format.
 
@@ -75,10 +90,8 @@ class ResultVisualizer:
             "Generating interactive 3D HTML visualization of the conformation..."
         )
 
-        coords: NDArray[np.float64] = np.array(
-            [(b.x, b.y, b.z) for b in self._coordinates_3d]
-        )
-        symbols: list[str] = [b.symbol for b in self._coordinates_3d]
+        coords: NDArray[np.float64] = self._coords
+        symbols: list[str] = self._symbols
 
         cmap: Colormap = cm.get_cmap("hsv", len(coords))
         colors: list[str] = [
@@ -249,13 +262,12 @@ class ResultVisualizer:
         import matplotlib.pyplot as plt
         import numpy as np
         from matplotlib import animation
+        from matplotlib.lines import Line2D
 
         logger.debug("Generating 3D rotating GIF visualization of the conformation...")
 
-        coords: NDArray[np.float64] = np.array(
-            [(b.x, b.y, b.z) for b in self._coordinates_3d]
-        )
-        symbols: list[str] = [b.symbol for b in self._coordinates_3d]
+        coords: NDArray[np.float64] = self._coords
+        symbols: list[str] = self._symbols
 
         cmap: Colormap = plt.get_cmap("hsv", len(coords))
         colors: list[tuple[float, float, float, float]] = [
@@ -287,14 +299,31 @@ class ResultVisualizer:
             label="Protein bonds",
         )
 
-        scatter_handles: list[Axes3D.scatter] = []
-        for i, (x, y, z, sym, color) in enumerate(
-            zip(coords[:, 0], coords[:, 1], coords[:, 2], symbols, colors, strict=True)
-        ):
-            sc: Axes3D.scatter = ax.scatter(
-                x, y, z, c=[color], s=90, edgecolors="black", label=f"{sym} (Index {i})"
+        # One batched scatter call for all beads instead of N separate artists;
+        # per-bead legend entries are provided via lightweight proxy handles.
+        beads_scatter: Axes3D.scatter = ax.scatter(
+            coords[:, 0],
+            coords[:, 1],
+            coords[:, 2],
+            c=colors,
+            s=90,
+            edgecolors="black",
+        )
+        scatter_handles: list[Axes3D.scatter] = [beads_scatter]
+
+        legend_proxies: list[Line2D] = [
+            Line2D(
+                [0],
+                [0],
+                marker="o",
+                color="w",
+                markerfacecolor=color,
+                markeredgecolor="black",
+                markersize=9,
+                label=f"{sym} (Index {i})",
             )
-            scatter_handles.append(sc)
+            for i, (sym, color) in enumerate(zip(symbols, colors, strict=True))
+        ]
 
         ax.set_title(
             f"3D Protein Folding Visualization for main chain sequence: {''.join(symbols)}",
@@ -303,7 +332,12 @@ class ResultVisualizer:
         ax.set_xlabel("X")
         ax.set_ylabel("Y")
         ax.set_zlabel("Z")
-        ax.legend(loc="upper left", bbox_to_anchor=(1.05, 1))
+        lattice_handle, bonds_handle = ax.get_legend_handles_labels()[0]
+        ax.legend(
+            handles=[lattice_handle, bonds_handle, *legend_proxies],
+            loc="upper left",
+            bbox_to_anchor=(1.05, 1),
+        )
 
         def __update_animation(angle: float) -> list[Axes3D.scatter]:
             """Helper function handler for FuncAnimation."""
@@ -322,13 +356,16 @@ class ResultVisualizer:
         plt.close(fig)
         logger.info("3D rotating GIF visualization saved to: %s", gif_path)
 
-    def visualize_2d(self, filename: str = FLAT_VISUALIZATION_FILENAME) -> None:
+    def visualize_2d(
+        self, filename: str = FLAT_VISUALIZATION_FILENAME, *, show_plot: bool = False
+    ) -> None:
         """Generate flat, 2D visualization of the resulting conformation in the .png file format.
 
         This plot is a 2D projection (top-down view) of the 3D coordinates.
 
         Args:
             filename (str): The name of the file to save the static .png visualization. Defaults to FLAT_VISUALIZATION_FILENAME.
+            show_plot (bool): Whether to open the plot in an interactive window after saving. Defaults to False so batch runs stay headless.
 
         """
         import matplotlib.pyplot as plt
@@ -337,12 +374,10 @@ class ResultVisualizer:
 
         logger.debug("Generating 2D flat visualization of the conformation...")
 
-        symbols: list[str] = [b.symbol for b in self._coordinates_3d]
+        symbols: list[str] = self._symbols
         contacts: dict[int, int] = self._main_main_contacts_detected
 
-        coords_3d: NDArray[np.float64] = np.array(
-            [(b.x, b.y, b.z) for b in self._coordinates_3d]
-        )
+        coords_3d: NDArray[np.float64] = self._coords
         x_coords: NDArray[np.float64] = coords_3d[:, 0]
         y_coords: NDArray[np.float64] = coords_3d[:, 1]
         z_coords: NDArray[np.float64] = coords_3d[:, 2]
@@ -453,6 +488,8 @@ class ResultVisualizer:
 
         filepath: Path = self._dirpath / filename
         plt.savefig(filepath, format="png", bbox_inches="tight", dpi=150)
+        if show_plot:
+            plt.show()
         plt.close(fig)
         logger.info("2D flat visualization saved to: %s", filepath)
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
+from qiskit.exceptions import QiskitError
 from qiskit.quantum_info import (
     Pauli,
+    PauliList,
     SparsePauliOp,
 )
 
@@ -27,11 +30,16 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+@lru_cache(maxsize=64)
 def build_identity_op(
     num_qubits: int, coeff: float = IDENTITY_OP_COEFF
 ) -> SparsePauliOp:
     """Builds a full identity Pauli operator for a given number of qubits.
 
+    Results are memoized per (num_qubits, coeff); identity operators are
+    requested repeatedly for the same sizes and are never mutated in this
+    codebase, so the cached instances can be shared safely.
+
     Args:
         num_qubits (int): Number of qubits in the operator.
         coeff (float, optional): Coefficient for the operator. Defaults to IDENTITY_OP_COEFF.
@@ -40,13 +48,51 @@ def build_identity_op(
         SparsePauliOp: Identity Pauli operator.
 
     """
-    identity_string: str = "I" * num_qubits
-    return SparsePauliOp.from_list([(identity_string, coeff)])
+    table: NDArray[np.bool] = np.zeros((1, num_qubits), dtype=bool)
+    return SparsePauliOp(
+        PauliList.from_symplectic(table, table), np.array([coeff], dtype=complex)
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_turn_qubit_batch(num_qubits: int) -> tuple[SparsePauliOp, ...]:
+    """Builds the turn qubit operators for every index of a register at once.
+
+    A single symplectic table holds the identity and Z rows of all
+    ``NORM_FACTOR * (I - Z_i)`` operators, so Qiskit's PauliList constructor
+    runs once per register size instead of once per turn qubit; the per-index
+    operators are cheap two-row slices of that table. Results are memoized
+    per register size and shared, which is safe because turn qubit operators
+    are never mutated in this codebase.
+
+    Args:
+        num_qubits (int): Total number of qubits in the register.
+
+    Returns:
+        tuple[SparsePauliOp, ...]: Turn qubit operator for each qubit index.
+
+    """
+    table_z: NDArray[np.bool] = np.zeros((2 * num_qubits, num_qubits), dtype=bool)
+    np.fill_diagonal(table_z[1::2], True)
+    table_x: NDArray[np.bool] = np.zeros_like(table_z)
+
+    paulis: PauliList = PauliList.from_symplectic(table_z, table_x)
+    coeffs: NDArray[np.complex128] = np.array(
+        [NORM_FACTOR, -NORM_FACTOR], dtype=complex
+    )
+
+    return tuple(
+        SparsePauliOp(paulis[2 * index : 2 * index + 2], coeffs.copy())
+        for index in range(num_qubits)
+    )
 
 
 def build_turn_qubit(z_index: int, num_qubits: int) -> SparsePauliOp:
     """Builds a turn qubit Pauli operator with Z at the specified index.
 
+    Operators are served from the memoized per-register batch, so every bead
+    of every chain of the same length shares the same prebuilt instances.
+
     Args:
         z_index (int): Index of the qubit to place a Z operator.
         num_qubits (int): Total number of qubits.
@@ -54,14 +100,15 @@ def build_turn_qubit(z_index: int, num_qubits: int) -> SparsePauliOp:
     Returns:
         SparsePauliOp: Pauli operator representing the turn qubit.
 
-    """
-    z_operator: SparsePauliOp = SparsePauliOp.from_sparse_list(
-        [("Z", [z_index], 1.0)], num_qubits=num_qubits
-    )
+    Raises:
+        QiskitError: If z_index does not address a qubit within the operator.
 
-    full_identity: SparsePauliOp = build_identity_op(num_qubits=num_qubits)
+    """
+    if not 0 <= z_index < num_qubits:
+        msg: str = f"Qubit index {z_index} out of range for {num_qubits} qubits."
+        raise QiskitError(msg)
 
-    return NORM_FACTOR * (full_identity - z_operator)
+    return _build_turn_qubit_batch(num_qubits)[z_index]
 
 
 def build_pauli_z_operator(num_qubits: int, pauli_z_indices: set[int]) -> SparsePauliOp:
@@ -75,16 +122,54 @@ def build_pauli_z_operator(num_qubits: int, pauli_z_indices: set[int]) -> Sparse
         SparsePauliOp: Constructed Pauli operator.
 
     """
-    if not pauli_z_indices:
-        return SparsePauliOp.from_list([("I" * num_qubits, 1.0)])
+    table_z: NDArray[np.bool] = np.zeros((1, num_qubits), dtype=bool)
+    if pauli_z_indices:
+        table_z[0, sorted(pauli_z_indices)] = True
+    table_x: NDArray[np.bool] = np.zeros_like(table_z)
 
-    idx_sorted = sorted(pauli_z_indices)
-    local_label = "Z" * len(idx_sorted)
+    return SparsePauliOp(
+        PauliList.from_symplectic(table_z, table_x), np.array([1.0], dtype=complex)
+    )
+
+
+def tensor_kron(left: SparsePauliOp, right: SparsePauliOp) -> SparsePauliOp:
+    """Tensor product of two operators built directly on the symplectic tables.
+
+    Equivalent to ``left ^ right`` (``right`` on the low qubit indices), but
+    assembles the z/x columns with tile/repeat and the coefficients with an
+    outer product instead of going through the generic Qiskit tensor path.
+
+    Args:
+        left (SparsePauliOp): Operator placed on the high qubit indices.
+        right (SparsePauliOp): Operator placed on the low qubit indices.
 
-    return SparsePauliOp.from_sparse_list(
-        [(local_label, idx_sorted, 1.0)],
-        num_qubits=num_qubits,
+    Returns:
+        SparsePauliOp: The tensor product operator.
+
+    """
+    left_paulis: PauliList = left.paulis
+    right_paulis: PauliList = right.paulis
+
+    table_z: NDArray[np.bool] = np.concatenate(
+        [
+            np.tile(right_paulis.z, (left.size, 1)),
+            np.repeat(left_paulis.z, right.size, axis=0),
+        ],
+        axis=1,
+    )
+    table_x: NDArray[np.bool] = np.concatenate(
+        [
+            np.tile(right_paulis.x, (left.size, 1)),
+            np.repeat(left_paulis.x, right.size, axis=0),
+        ],
+        axis=1,
     )
+    phase: NDArray[np.int64] = np.repeat(left_paulis.phase, right.size) + np.tile(
+        right_paulis.phase, left.size
+    )
+    coeffs: NDArray[np.complex128] = np.outer(left.coeffs, right.coeffs).ravel()
+
+    return SparsePauliOp(PauliList.from_symplectic(table_z, table_x, phase), coeffs)
 
 
 def convert_to_qubits(pauli_op: SparsePauliOp) -> SparsePauliOp:
@@ -129,101 +214,49 @@ def fix_qubits(
 
     """
     # Normalize operators to SparsePauliOp
-    coeffs: NDArray[np.float64] = np.array([1.0])
     if isinstance(operator, Pauli):
-        operator = SparsePauliOp([operator], coeffs)
-
-    # Check if only one Pauli term is present, if so don't negate coeffs
-    if len(operator.paulis) == 1:
-        table_z = np.copy(operator.paulis[0].z)
-        table_x = np.copy(operator.paulis[0].x)
-        _preset_binary_vals(
-            table_z, has_side_chain_second_bead=has_side_chain_second_bead
-        )
-        return SparsePauliOp(
-            data=[Pauli((table_z, table_x))], coeffs=np.array([operator.coeffs[0]])
-        ).simplify()
-
-    new_paulis: list[Pauli] = []
-    new_coeffs: NDArray[np.float64] = np.array([])
-
-    for idx, pauli in enumerate(operator.paulis):
-        table_z = np.copy(pauli.z)
-        table_x = np.copy(pauli.x)
-        coeff = operator.coeffs[idx]
-
-        coeff = _calc_updated_coeffs(
-            table_z, coeff, has_side_chain_second_bead=has_side_chain_second_bead
-        )
-        _preset_binary_vals(
-            table_z, has_side_chain_second_bead=has_side_chain_second_bead
-        )
-        # Create new Pauli from updated z, x
-        new_pauli = Pauli((table_z, table_x))
-        new_paulis.append(new_pauli)
-        new_coeffs = np.append(new_coeffs, coeff)
-
-    return SparsePauliOp(new_paulis, new_coeffs).simplify()
-
-
-def _calc_updated_coeffs(
-    table_z: NDArray[np.bool], coeff: float, *, has_side_chain_second_bead: bool
-) -> float:
-    """Update coefficients based on fixed qubit positions.
+        operator = SparsePauliOp([operator], np.array([1.0]))
+
+    table_z: NDArray[np.bool] = np.array(operator.paulis.z, dtype=bool)
+    table_x: NDArray[np.bool] = np.array(operator.paulis.x, dtype=bool)
+    coeffs: NDArray[np.complex128] = np.array(operator.coeffs, copy=True)
+    num_qubits: int = table_z.shape[1]
+
+    # Coefficients are only negated for multi-term operators; single-term
+    # operators just have their fixed positions preset.
+    if len(coeffs) > 1:
+        if num_qubits > SIGN_FLIP_SECOND_QUBIT_INDEX:
+            coeffs[table_z[:, SIGN_FLIP_SECOND_QUBIT_INDEX]] *= -1
+        if (not has_side_chain_second_bead) and (
+            num_qubits > SIGN_FLIP_SIXTH_QUBIT_INDEX + 1
+        ):
+            coeffs[table_z[:, SIGN_FLIP_SIXTH_QUBIT_INDEX]] *= -1
+
+    fixed_positions: list[int] = _fixed_positions(
+        num_qubits, has_side_chain_second_bead=has_side_chain_second_bead
+    )
+    table_z[:, fixed_positions] = False
 
-    Args:
-        table_z (NDArray[np.bool]): Z values for each qubit.
-        coeff (float): Original coefficient.
-        has_side_chain_second_bead (bool): Whether second bead of side chain exists.
+    return SparsePauliOp(PauliList.from_symplectic(table_z, table_x), coeffs).simplify()
 
-    Returns:
-        float: Updated coefficient.
 
-    """
-    # Negate coeff if table_z[1] == True
-    if (
-        len(table_z) > SIGN_FLIP_SECOND_QUBIT_INDEX
-        and table_z[SIGN_FLIP_SECOND_QUBIT_INDEX]
-    ):
-        coeff = -1 * coeff
-    # Negate coeff if index 5 == True and no side_chain
-    if (not has_side_chain_second_bead) and (
-        len(table_z) > SIGN_FLIP_SIXTH_QUBIT_INDEX + 1
-        and table_z[SIGN_FLIP_SIXTH_QUBIT_INDEX]
-    ):
-        coeff = -1 * coeff
-    return coeff
-
-
-def _preset_binary_vals(
-    table_z: NDArray[np.bool], *, has_side_chain_second_bead: bool
-) -> None:
-    """Set False for main bead indices in the Z table.
+def _fixed_positions(num_qubits: int, *, has_side_chain_second_bead: bool) -> list[int]:
+    """Return the fixed main-chain qubit positions within the operator size.
 
     Args:
-        table_z (NDArray[np.bool]): Z values for each qubit.
+        num_qubits (int): Number of qubits in the operator.
         has_side_chain_second_bead (bool): Whether second bead of side chain exists.
 
+    Returns:
+        list[int]: In-range qubit indices whose Z values are preset to False.
+
     """
     main_beads_indices = MAIN_CHAIN_FIXED_POSITIONS.copy()
 
     if not has_side_chain_second_bead:
         main_beads_indices.append(MAIN_CHAIN_FIFTH_FIXED_POSITION)
 
-    for index in main_beads_indices:
-        _preset_single_binary_val(table_z, index)
-
-
-def _preset_single_binary_val(table_z: NDArray[np.bool], index: int) -> None:
-    """Set a single qubit value to False.
-
-    Args:
-        table_z (NDArray[np.bool]): Z values for each qubit.
-        index (int): Qubit index to set.
-
-    """
-    if index < len(table_z):
-        table_z[index] = False
+    return [index for index in main_beads_indices if index < num_qubits]
 
 
 def pad_to_n_qubits(op: SparsePauliOp, target: int) -> SparsePauliOp:
@@ -246,10 +279,20 @@ def pad_to_n_qubits(op: SparsePauliOp, target: int) -> SparsePauliOp:
 
     if op.num_qubits == target:
         return op
-    pad = target - op.num_qubits
-    id_pad = build_identity_op(pad)
+
     logger.debug("Padding operator from %s to %s qubits.", op.num_qubits, target)
-    return id_pad ^ op
+
+    pad = target - op.num_qubits
+    zero_columns: NDArray[np.bool] = np.zeros((len(op.paulis), pad), dtype=bool)
+    table_z: NDArray[np.bool] = np.hstack([op.paulis.z, zero_columns])
+    table_x: NDArray[np.bool] = np.hstack([op.paulis.x, zero_columns])
+
+    # Appending on the high-index side matches tensoring an identity on top,
+    # preserving the little-endian qubit convention.
+    return SparsePauliOp(
+        PauliList.from_symplectic(table_z, table_x, op.paulis.phase),
+        op.coeffs.copy(),
+    )
 
 
 def find_unused_qubits(op: SparsePauliOp) -> list[int]:
@@ -271,8 +314,8 @@ def find_unused_qubits(op: SparsePauliOp) -> list[int]:
 
     if op.num_qubits == 0 or len(op.paulis) == 0:
         return []
-    used_mask = np.any(op.paulis.z, axis=0)
-    return [i for i, used in enumerate(used_mask) if not used]
+    used_mask = np.any(op.paulis.z | op.paulis.x, axis=0)
+    return np.where(~used_mask)[0].tolist()
 
 
 def remove_unused_qubits(
@@ -301,10 +344,9 @@ def remove_unused_qubits(
     mask = np.ones(op.num_qubits, dtype=bool)
     mask[unused] = False
 
-    z_full = op.paulis.z
-    x_full = op.paulis.x
-    new_paulis: list[Pauli] = [
-        Pauli((z_full[k][mask], x_full[k][mask])) for k in range(len(op.paulis))
-    ]
+    table_z: NDArray[np.bool] = op.paulis.z[:, mask]
+    table_x: NDArray[np.bool] = op.paulis.x[:, mask]
 
-    return SparsePauliOp(new_paulis, coeffs=op.coeffs).simplify()
+    return SparsePauliOp(
+        PauliList.from_symplectic(table_z, table_x, op.paulis.phase), coeffs=op.coeffs
+    ).simplify()
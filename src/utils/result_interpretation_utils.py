@@ -6,10 +6,13 @@ import dataclasses
 import json
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 from constants import (
     XYZ_FILE_LINE_START_INDEX,
     XYZ_FILE_PARTS_PER_LINE,
@@ -42,14 +45,18 @@ def create_xyz_file(coords: list[BeadPosition], dirpath: Path) -> Path:
     filepath: Path = dirpath / XYZ_FILENAME
 
     try:
+        xyz_rows: NDArray[np.object_] = np.array(
+            [
+                (bead_pos.symbol, bead_pos.x, bead_pos.y, bead_pos.z)
+                for bead_pos in coords
+            ],
+            dtype=object,
+        )
         with filepath.open("w") as f:
-            f.write(f"{len(coords)}\n")
-            f.write("Generated by QFold-Thesis/quantum-protein-folding\n")
-
-            for bead_pos in coords:
-                f.write(
-                    f"{bead_pos.symbol:<2} {bead_pos.x:>10.4f} {bead_pos.y:>10.4f} {bead_pos.z:>10.4f}\n"
-                )
+            f.write(
+                f"{len(coords)}\nGenerated by QFold-Thesis/quantum-protein-folding\n"
+            )
+            np.savetxt(f, xyz_rows, fmt="%-2s %10.4f %10.4f %10.4f")
     except Exception:
         logger.exception("Error creating XYZ file")
         raise
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.constants import CONFORMATION_ENCODING
+from src.protein.bead.main_bead import _MainBead
+
+
+# Compared by name: the test imports resolve modules under the src. prefix,
+# while constants.py resolves the enums module directly.
+@pytest.mark.skipif(
+    CONFORMATION_ENCODING.name != "DENSE",
+    reason="Dense turn operators only exist in dense encoding",
+)
+def test_dense_turn_operators_are_canonical_products():
+    bead = _MainBead(symbol="A", index=2, parent_chain_len=7)
+
+    identity = bead._full_identity
+    q0, q1 = bead.turn_qubits[0], bead.turn_qubits[1]
+    expected = (
+        ((identity - q0) @ (identity - q1)).simplify(),
+        (q1 @ (q1 - q0)).simplify(),
+        (q0 @ (q0 - q1)).simplify(),
+        (q0 @ q1).simplify(),
+    )
+
+    for direction, expected_op in enumerate(expected):
+        turn_op = bead._turns[direction]
+
+        # Directly constructed terms must already be canonical: no duplicate
+        # Paulis, no zero coefficients, so simplify() would be a no-op.
+        labels = turn_op.paulis.to_labels()
+        assert len(labels) == len(set(labels))
+        assert np.all(turn_op.coeffs != 0)
+
+        difference = (turn_op - expected_op).simplify()
+        assert np.allclose(difference.coeffs, 0)
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from src.constants import FCC_BASIS
+
+# ---- FCC_BASIS -------------------------------------------------------------
+
+
+def test_fcc_basis_round_trip_sums_to_zero():
+    assert np.allclose(FCC_BASIS.sum(axis=0), 0.0)
+
+
+def test_fcc_basis_is_read_only():
+    with pytest.raises(ValueError, match="read-only"):
+        FCC_BASIS[0, 0] = 1.0
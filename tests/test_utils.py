@@ -21,17 +21,17 @@ from src.utils.qubit_utils import (
 # ---- Fixtures --------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_pauli() -> SparsePauliOp:
     return SparsePauliOp.from_list([("ZI", 1.0)])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def single_term_op() -> SparsePauliOp:
     return SparsePauliOp.from_list([("ZZZZZZ", 1.0)])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_term_op() -> SparsePauliOp:
     return SparsePauliOp.from_list([("ZZZZZZ", 1.0), ("IIIIII", 0.5)])
 
@@ -158,6 +158,16 @@ def test_fix_qubits_raises_on_invalid_operator():
         fix_qubits(None)
 
 
+def test_fix_qubits_distributes_over_squared_sum():
+    axes = [
+        SparsePauliOp.from_list([("IIIZIZ", 1.0), ("IZIIII", -0.5)]),
+        SparsePauliOp.from_list([("ZIIIIZ", 0.5), ("IIZIII", 1.0)]),
+    ]
+    per_axis = fix_qubits(SparsePauliOp.sum([fix_qubits(axis) ** 2 for axis in axes]))
+    summed = fix_qubits(SparsePauliOp.sum([axis**2 for axis in axes]))
+    assert per_axis == summed
+
+
 # ---------------------------------------------------------------------------
 # unused_qubits
 # ---------------------------------------------------------------------------